@@ -0,0 +1,114 @@
+import os
+import struct
+import threading
+import imageio
+import numpy as np
+import pygame
+from PIL import Image
+
+# Decoded GIF frames are kept in memory per (file, size) and, optionally, in a
+# raw "atlas" file next to the GIF: a header followed by every resized frame
+# as plain RGB bytes, so later runs skip GIF decoding and resizing entirely.
+# An atlas at full window size is large (about 2 MB per frame), hence opt-in.
+ATLAS_MAGIC = b'GIFA'
+ATLAS_VERSION = 1
+ATLAS_HEADER = struct.Struct('<4sHHHIqq')   # magic, version, width, height, frames, source size, source mtime
+
+_animations = {}
+_animations_lock = threading.Lock()
+
+
+def atlas_path(filename, size):
+    return f"{filename}.{size[0]}x{size[1]}.atlas"
+
+
+class Animation:
+    """Frames of one GIF scaled to `size`, filled in by a background thread.
+
+    frames grows while loading runs and done is set once every frame is
+    there, so the first frame can be shown as soon as it is decoded.
+    """
+
+    def __init__(self, filename, size, use_atlas=False):
+        self.filename = filename
+        self.size = size
+        self.use_atlas = use_atlas
+        self.frames = []
+        self.done = False
+        self.thread = threading.Thread(target=self._load, daemon=True)
+        self.thread.start()
+
+    def _load(self):
+        try:
+            if not (self.use_atlas and self._load_atlas()):
+                self._decode()
+        finally:
+            self.done = True
+
+    def _source_stamp(self):
+        stat = os.stat(self.filename)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _load_atlas(self):
+        path = atlas_path(self.filename, self.size)
+        try:
+            data = np.memmap(path, dtype=np.uint8, mode='r')
+            magic, version, width, height, count, source_size, source_mtime = \
+                ATLAS_HEADER.unpack_from(bytes(data[:ATLAS_HEADER.size]))
+        except (OSError, ValueError, struct.error):
+            return False
+        frame_size = width * height * 3
+        if (magic, version, (width, height)) != (ATLAS_MAGIC, ATLAS_VERSION, tuple(self.size)) or \
+                (source_size, source_mtime) != self._source_stamp() or \
+                len(data) != ATLAS_HEADER.size + count * frame_size:
+            return False
+        for i in range(count):
+            # The surfaces share the mapped file's memory; nothing is copied or decoded
+            start = ATLAS_HEADER.size + i * frame_size
+            self.frames.append(pygame.image.frombuffer(data[start:start + frame_size], self.size, 'RGB'))
+        return True
+
+    def _decode(self):
+        raw_frames = []
+        for frame in imageio.get_reader(self.filename):
+            image = Image.fromarray(np.asarray(frame)).convert('RGB').resize(self.size, resample=Image.BILINEAR)
+            raw = image.tobytes()
+            if self.use_atlas:
+                raw_frames.append(raw)
+            self.frames.append(pygame.image.fromstring(raw, self.size, 'RGB'))
+        if self.use_atlas:
+            self._write_atlas(raw_frames)
+
+    def _write_atlas(self, raw_frames):
+        path = atlas_path(self.filename, self.size)
+        source_size, source_mtime = self._source_stamp()
+        try:
+            with open(path + '.tmp', 'wb') as f:
+                f.write(ATLAS_HEADER.pack(ATLAS_MAGIC, ATLAS_VERSION, self.size[0], self.size[1],
+                                          len(raw_frames), source_size, source_mtime))
+                for raw in raw_frames:
+                    f.write(raw)
+            os.replace(path + '.tmp', path)
+        except OSError:
+            pass
+
+    def frame(self, index):
+        """Frame at index, the last loaded frame if that one is not ready yet, or None."""
+        if not self.frames:
+            return None
+        return self.frames[min(index, len(self.frames) - 1)]
+
+    def next_index(self, index):
+        # Hold on the newest frame until more arrive; loop once all are loaded
+        if index + 1 < len(self.frames):
+            return index + 1
+        return 0 if self.done else index
+
+
+def get_animation(filename, size, use_atlas=False):
+    """Cached Animation for filename at size; loading starts on the first call."""
+    key = (filename, tuple(size))
+    with _animations_lock:
+        if key not in _animations:
+            _animations[key] = Animation(filename, tuple(size), use_atlas)
+        return _animations[key]
@@ -0,0 +1,58 @@
+import os
+import sys
+import time
+import pygame
+
+# Asset files live in the project root, next to main.py and the checkers package,
+# so they are found whatever the working directory is
+ASSET_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_cache = {}
+# Seconds each loaded asset took, by label ('king.png', 'king.png@78x78', ...)
+load_times = {}
+
+
+def asset_path(name):
+    return os.path.join(ASSET_DIR, name)
+
+
+def _cached(label, load):
+    if label not in _cache:
+        start = time.perf_counter()
+        _cache[label] = load()
+        load_times[label] = time.perf_counter() - start
+    return _cache[label]
+
+
+def image(name, size=None):
+    """Surface for an image file, scaled to size when given; loaded on first use and cached."""
+    if size is None:
+        return _cached(name, lambda: pygame.image.load(asset_path(name)))
+    original = image(name)
+    return _cached(f"{name}@{size[0]}x{size[1]}", lambda: pygame.transform.scale(original, size))
+
+
+def sound(name):
+    """pygame Sound for an audio file; loaded on first use and cached."""
+    return _cached(name, lambda: pygame.mixer.Sound(asset_path(name)))
+
+
+def report(file=sys.stdout):
+    # Slowest first; a scaled image ('name@WxH') only counts the scaling, its original is listed separately
+    total = 0.0
+    for label, seconds in sorted(load_times.items(), key=lambda item: -item[1]):
+        print(f"{label:32} {seconds * 1000:8.1f} ms", file=file)
+        total += seconds
+    print(f"{'total':32} {total * 1000:8.1f} ms", file=file)
+
+
+if __name__ == '__main__':
+    # Load every image and sound once to see what each one costs
+    pygame.init()
+    pygame.mixer.init()
+    for name in sorted(os.listdir(ASSET_DIR)):
+        if name.endswith(('.png', '.jpg')):
+            image(name)
+        elif name.endswith('.mp3'):
+            sound(name)
+    report()
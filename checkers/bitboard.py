@@ -0,0 +1,209 @@
+from .constants import ROWS, COLS, RED, WHITE, SOLDIER, QUEEN, KING, PIECE_VALUES, DIRECTIONS
+from .board import Board
+from .piece import Piece
+from .zobrist import ZOBRIST
+
+# Square index is row * COLS + col, so bit 0 is the top-left cell
+SQUARES = ROWS * COLS
+FULL = (1 << SQUARES) - 1
+FIRST_COL = sum(1 << (row * COLS) for row in range(ROWS))
+LAST_COL = FIRST_COL << (COLS - 1)
+
+COLORS = (WHITE, RED)
+TYPES = (SOLDIER, QUEEN, KING)
+VALUES = tuple(PIECE_VALUES[piece_type] for piece_type in TYPES)
+# Material of one piece per mask index, positive for WHITE as in Board.evaluate
+SIGNED_VALUES = VALUES + tuple(-value for value in VALUES)
+KING_INDEX = 2
+# Same keys as Board.hash, so both representations hash a position identically
+KEYS = tuple(ZOBRIST[(color, piece_type)] for color in COLORS for piece_type in TYPES)
+
+def _shifts(directions):
+    # For each direction: the bit delta and the mask of squares that may move that way
+    shifts = []
+    for dr, dc in directions:
+        sources = FULL
+        if dc < 0:
+            sources &= ~FIRST_COL
+        elif dc > 0:
+            sources &= ~LAST_COL
+        shifts.append((dr * COLS + dc, dr, dc, sources))
+    return tuple(shifts)
+
+
+# SHIFTS[color_index][type_index] -> ((delta, dr, dc, source mask), ...)
+SHIFTS = tuple(
+    tuple(_shifts(DIRECTIONS[(color, piece_type)]) for piece_type in TYPES)
+    for color in COLORS
+)
+
+
+class BitBoard:
+    """Compact position: one 81-bit int per color x piece type.
+
+    masks[color_index * 3 + type_index], with WHITE = 0 / RED = 1 and
+    soldier / queen / king = 0 / 1 / 2. Speaks the same search interface
+    as Board (legal_moves, make_move, unmake_move, child, evaluate,
+    winner) and the same (from_row, from_col, to_row, to_col, captured)
+    moves. squares maps each square to the index of the mask holding its
+    piece (-1 when empty) so make_move never scans the masks, and the
+    material score is kept up to date like Board.material.
+    """
+
+    def __init__(self, masks=None):
+        self.masks = list(masks) if masks else [0] * 6
+        self.squares = [-1] * SQUARES
+        for index, mask in enumerate(self.masks):
+            while mask:
+                low = mask & -mask
+                mask ^= low
+                self.squares[low.bit_length() - 1] = index
+        self.material = sum(SIGNED_VALUES[i] * mask.bit_count() for i, mask in enumerate(self.masks))
+        self.red_left = self.white_left = 0
+        self.red_kings = self.white_kings = 0
+        self.hash = 0
+
+    @classmethod
+    def from_board(cls, board):
+        masks = [0] * 6
+        for row in board.board:
+            for piece in row:
+                if piece != 0:
+                    index = COLORS.index(piece.color) * 3 + TYPES.index(piece.type)
+                    masks[index] |= 1 << (piece.row * COLS + piece.col)
+        bitboard = cls(masks)
+        bitboard.red_left, bitboard.white_left = board.red_left, board.white_left
+        bitboard.red_kings, bitboard.white_kings = board.red_kings, board.white_kings
+        bitboard.hash = board.hash
+        return bitboard
+
+    def to_board(self):
+        board = Board.__new__(Board)
+        board.turn = WHITE
+        board.board = [[0] * COLS for _ in range(ROWS)]
+        for index, mask in enumerate(self.masks):
+            color, piece_type = COLORS[index // 3], TYPES[index % 3]
+            while mask:
+                low = mask & -mask
+                square = low.bit_length() - 1
+                mask ^= low
+                row, col = divmod(square, COLS)
+                board.board[row][col] = Piece(row, col, piece_type, color)
+        board.red_left, board.white_left = self.red_left, self.white_left
+        board.red_kings, board.white_kings = self.red_kings, self.white_kings
+        board.hash = self.hash
+        board.material = self.material
+        return board
+
+    def copy(self):
+        bitboard = BitBoard.__new__(BitBoard)
+        bitboard.masks = self.masks[:]
+        bitboard.squares = self.squares[:]
+        bitboard.material = self.material
+        bitboard.red_left, bitboard.white_left = self.red_left, self.white_left
+        bitboard.red_kings, bitboard.white_kings = self.red_kings, self.white_kings
+        bitboard.hash = self.hash
+        return bitboard
+
+    def occupied(self, color):
+        base = COLORS.index(color) * 3
+        return self.masks[base] | self.masks[base + 1] | self.masks[base + 2]
+
+    def evaluate(self):
+        return self.material
+
+    def winner(self):
+        if self.red_left <= 0:
+            return WHITE
+        elif self.white_left <= 0:
+            return RED
+
+        return None
+
+    def legal_moves(self, color):
+        return list(self.generate_moves(color))
+
+    def generate_moves(self, color, captures=None):
+        """Yield moves one at a time; captures=True/False limits them to captures/quiet moves."""
+        color_index = 0 if color == WHITE else 1
+        base = color_index * 3
+        masks = self.masks
+        enemy_base = 3 - base
+        enemies = ()
+        if captures is not True:
+            enemies += ((None, ~(masks[0] | masks[1] | masks[2] | masks[3] | masks[4] | masks[5])),)
+        if captures is not False:
+            enemies += tuple((TYPES[i], masks[enemy_base + i]) for i in range(3))
+        for type_index, shifts in enumerate(SHIFTS[color_index]):
+            pieces = masks[base + type_index]
+            if not pieces:
+                continue
+            for delta, dr, dc, sources in shifts:
+                movers = pieces & sources
+                reached = (movers << delta if delta > 0 else movers >> -delta) & FULL
+                # Split the reachable squares into empty ones and captures by victim type
+                for captured, mask in enemies:
+                    targets = reached & mask
+                    while targets:
+                        low = targets & -targets
+                        square = low.bit_length() - 1
+                        targets ^= low
+                        row, col = divmod(square, COLS)
+                        yield row - dr, col - dc, row, col, captured
+
+    def is_legal(self, move, color):
+        return move in self.generate_moves(color, move[4] is not None)
+
+    def make_move(self, move):
+        from_row, from_col, row, col = move[:4]
+        from_square = from_row * COLS + from_col
+        to_square = row * COLS + col
+        from_bit = 1 << from_square
+        to_bit = 1 << to_square
+        masks = self.masks
+        squares = self.squares
+        moved = squares[from_square]
+        captured = squares[to_square]
+        undo = (moved, captured, from_square, to_square, from_bit, to_bit, self.hash, self.material,
+                self.red_left, self.white_left, self.red_kings, self.white_kings)
+
+        masks[moved] ^= from_bit
+        self.hash ^= KEYS[moved][from_square]
+        if captured >= 0:
+            masks[captured] ^= to_bit
+            self.hash ^= KEYS[captured][to_square]
+            self.material -= SIGNED_VALUES[captured]
+            if captured >= 3:
+                self.red_left -= 1
+            else:
+                self.white_left -= 1
+
+        landed = moved
+        if row == 0 or row == ROWS - 1:
+            landed = moved - moved % 3 + KING_INDEX
+            self.material += SIGNED_VALUES[landed] - SIGNED_VALUES[moved]
+            if moved < 3:
+                self.white_kings += 1
+            else:
+                self.red_kings += 1
+        masks[landed] |= to_bit
+        self.hash ^= KEYS[landed][to_square]
+        squares[from_square] = -1
+        squares[to_square] = landed
+        return undo + (landed,)
+
+    def unmake_move(self, undo):
+        moved, captured, from_square, to_square, from_bit, to_bit, self.hash, self.material, \
+            self.red_left, self.white_left, self.red_kings, self.white_kings, landed = undo
+        masks = self.masks
+        masks[landed] ^= to_bit
+        masks[moved] |= from_bit
+        if captured >= 0:
+            masks[captured] |= to_bit
+        self.squares[from_square] = moved
+        self.squares[to_square] = captured
+
+    def child(self, move):
+        bitboard = self.copy()
+        bitboard.make_move(move)
+        return bitboard
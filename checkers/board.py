@@ -1,30 +1,57 @@
-import pygame
-from pygame.locals import *
-from .constants import BLACK, ROWS, COLS, RED, SQUARE_SIZE, WHITE, GREY
+from copy import deepcopy
+from .constants import ROWS, COLS, RED, WHITE, SOLDIER, QUEEN, KING, DIRECTIONS, PIECE_VALUES
 from .piece import Piece
+from .zobrist import piece_key, hash_board
+
+
+def material_value(piece):
+    # Signed weight of a piece in the material score: positive for WHITE
+    value = PIECE_VALUES[piece.type]
+    return value if piece.color == WHITE else -value
+
+
+# Compact position encodings (Board.to_bytes / Board.to_fen). Every square
+# gets a code: 0 when empty, 1-6 for (color, type). The binary form packs
+# the 81 codes at 3 bits each, first square lowest, followed by one bit
+# that is set when RED is to move: 244 bits in 31 bytes.
+SQUARE_CODES = {(color, type): 1 + i * 3 + j
+                for i, color in enumerate((WHITE, RED))
+                for j, type in enumerate((SOLDIER, QUEEN, KING))}
+CODE_SQUARES = {code: square for square, code in SQUARE_CODES.items()}
+PACKED_SIZE = (ROWS * COLS * 3 + 1 + 7) // 8
+# FEN-like text: rows top to bottom separated by '/', a digit for a run of
+# empty squares, S/Q/K for WHITE and s/q/k for RED pieces, then 'w' or 'r'
+# for the side to move, e.g. "1K1K1K1K1/Q1Q1Q1Q1Q/.../1k1k1k1k1 r"
+FEN_PIECES = {'S': (WHITE, SOLDIER), 'Q': (WHITE, QUEEN), 'K': (WHITE, KING),
+              's': (RED, SOLDIER), 'q': (RED, QUEEN), 'k': (RED, KING)}
+PIECE_FEN = {square: char for char, square in FEN_PIECES.items()}
+FEN_SIDES = {'w': WHITE, 'r': RED}
 
-pygame.init()
-pygame.mixer.init()
-out_sound = pygame.mixer.Sound("pick-92276.mp3")
 
 class Board:
+    # Set to True to have evaluate() check the running material score against a full rescan
+    CHECK_MATERIAL = False
+
     def __init__(self):
         self.board = []
         self.red_left = self.white_left = 13
         self.red_kings = self.white_kings = 0
         self.turn = WHITE
         self.create_board()
+        self.hash = hash_board(self)
+        self.material = self.count_material()
 
-    def draw_cubes(self, win):
-        win.fill(BLACK)
-        for row in range(ROWS):
-            for col in range(row % 2, ROWS, 2):
-                pygame.draw.rect(win, WHITE, (row * SQUARE_SIZE, col * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
     '''
     def evaluate(self):
         return self.white_left - self.red_left + (self.white_kings * 0.5 - self.red_kings * 0.5)
     '''
     def evaluate(self):
+        # White minus red material, kept up to date by move, remove and make_move
+        if self.CHECK_MATERIAL:
+            assert self.material == self.count_material(), (self.material, self.count_material())
+        return self.material
+
+    def count_material(self):
         white_score = 0
         red_score = 0
 
@@ -32,18 +59,18 @@ class Board:
             for piece in row:
                 if piece != 0:
                     if piece.color == WHITE:
-                        if piece.type == 'soldier':
+                        if piece.type == SOLDIER:
                             white_score += 1
-                        elif piece.type == 'queen':
+                        elif piece.type == QUEEN:
                             white_score += 3
-                        elif piece.type == 'king':
+                        elif piece.type == KING:
                             white_score += 5
                     elif piece.color == RED:
-                        if piece.type == 'soldier':
+                        if piece.type == SOLDIER:
                             red_score += 1
-                        elif piece.type == 'queen':
+                        elif piece.type == QUEEN:
                             red_score += 3
-                        elif piece.type == 'king':
+                        elif piece.type == KING:
                             red_score += 5
 
         return white_score - red_score
@@ -64,6 +91,8 @@ class Board:
                 # Remove the captured piece
                 self.remove([target_piece])
             #print(f"Before move - Piece position: ({piece.row}, {piece.col}), Board state:")
+            self.hash ^= piece_key(piece)
+            self.material -= material_value(piece)
             self.board[piece.row][piece.col] = 0  
             self.board[row][col] = piece  
             piece.move(row, col) 
@@ -75,6 +104,8 @@ class Board:
                     self.white_kings += 1
                 else:
                     self.red_kings += 1
+            self.hash ^= piece_key(piece)
+            self.material += material_value(piece)
 
 
     def get_piece(self, row, col):
@@ -86,36 +117,29 @@ class Board:
             for col in range(COLS):
                 if col % 2 == ((row + 1) % 2):
                     if row == 0:
-                        self.board[row].append(Piece(row, col, 'king', WHITE))
+                        self.board[row].append(Piece(row, col, KING, WHITE))
                     elif row == 1:
-                        self.board[row].append(Piece(row, col, 'queen', WHITE))
+                        self.board[row].append(Piece(row, col, QUEEN, WHITE))
                     elif row == 2:
-                        self.board[row].append(Piece(row, col, 'soldier', WHITE))
+                        self.board[row].append(Piece(row, col, SOLDIER, WHITE))
                     elif row == 6:
-                        self.board[row].append(Piece(row, col, 'soldier', RED))
+                        self.board[row].append(Piece(row, col, SOLDIER, RED))
                     elif row == 7:
-                        self.board[row].append(Piece(row, col, 'queen', RED))
+                        self.board[row].append(Piece(row, col, QUEEN, RED))
                     elif row == 8:
-                        self.board[row].append(Piece(row, col, 'king', RED))
+                        self.board[row].append(Piece(row, col, KING, RED))
                     else:
                         self.board[row].append(0)
                 else:
                     self.board[row].append(0)
 
-    def draw(self, win):
-        self.draw_cubes(win)
-        for row in range(ROWS):
-            for col in range(COLS):
-                piece = self.board[row][col]
-                if piece != 0:
-                    piece.draw(win)
-
     def remove(self, pieces):
         
         for piece in pieces:
             if piece != 0:
                 self.board[piece.row][piece.col] = 0
-                out_sound.play()
+                self.hash ^= piece_key(piece)
+                self.material -= material_value(piece)
                 if piece.color == RED:
                     self.red_left -= 1
                 else:
@@ -130,23 +154,200 @@ class Board:
         
         return None 
 
+    def legal_moves(self, color):
+        return list(self.generate_moves(color))
+
+    def generate_moves(self, color, captures=None):
+        """Yield moves one at a time; captures=True/False limits them to captures/quiet moves.
+
+        Moves are (from_row, from_col, to_row, to_col, captured type or None)
+        tuples. The scan may be resumed after make_move/unmake_move pairs,
+        so a search never builds moves it prunes.
+        """
+        for row in self.board:
+            for piece in row:
+                if piece != 0 and piece.color == color:
+                    yield from self.piece_moves(piece, captures)
+
+    def piece_moves(self, piece, captures=None):
+        row, col = piece.row, piece.col
+        for dr, dc in DIRECTIONS[(piece.color, piece.type)]:
+            r, c = row + dr, col + dc
+            if 0 <= r < ROWS and 0 <= c < COLS:
+                target = self.board[r][c]
+                if target == 0:
+                    if captures is not True:
+                        yield row, col, r, c, None
+                elif target.color != piece.color and captures is not False:
+                    yield row, col, r, c, target.type
+
+    def is_legal(self, move, color):
+        piece = self.board[move[0]][move[1]]
+        return piece != 0 and piece.color == color and move in self.piece_moves(piece)
+
+    def make_move(self, move):
+        """Play a move in place (silently) and return the undo record for unmake_move."""
+        from_row, from_col, row, col = move[:4]
+        piece = self.board[from_row][from_col]
+        captured = self.board[row][col]
+        undo = (move, piece, captured, piece.type, piece.king, self.hash, self.material,
+                self.red_left, self.white_left, self.red_kings, self.white_kings)
+
+        self.hash ^= piece_key(piece)
+        if captured != 0:
+            self.hash ^= piece_key(captured)
+            self.material -= material_value(captured)
+            if captured.color == RED:
+                self.red_left -= 1
+            else:
+                self.white_left -= 1
+        self.board[from_row][from_col] = 0
+        self.board[row][col] = piece
+        piece.move(row, col)
+
+        if row == 0 or row == ROWS - 1:
+            self.material -= material_value(piece)
+            piece.make_king()
+            self.material += material_value(piece)
+            if piece.color == WHITE:
+                self.white_kings += 1
+            else:
+                self.red_kings += 1
+        self.hash ^= piece_key(piece)
+        return undo
+
+    def unmake_move(self, undo):
+        move, piece, captured, piece.type, piece.king, self.hash, self.material, \
+            self.red_left, self.white_left, self.red_kings, self.white_kings = undo
+        from_row, from_col, row, col = move[:4]
+        piece.move(from_row, from_col)
+        self.board[from_row][from_col] = piece
+        self.board[row][col] = captured
+
+    def child(self, move):
+        # Copy of the board with the move played, for handing results back to the game
+        board = deepcopy(self)
+        board.make_move(move)
+        return board
+
+    def to_bytes(self, turn):
+        """Position as PACKED_SIZE bytes with turn (WHITE or RED) as the side to move.
+
+        turn is required: self.turn is not kept up to date by the move
+        functions, the game and the searches track the side to move
+        themselves. Equal positions give equal bytes, so the result also
+        works as a dict key. from_bytes sets turn on the board it returns.
+        """
+        code = 0
+        shift = 0
+        for row in self.board:
+            for piece in row:
+                if piece != 0:
+                    code |= SQUARE_CODES[piece.color, piece.type] << shift
+                shift += 3
+        if turn == RED:
+            code |= 1 << shift
+        return code.to_bytes(PACKED_SIZE, 'little')
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) != PACKED_SIZE:
+            raise ValueError(f"expected {PACKED_SIZE} bytes, got {len(data)}")
+        code = int.from_bytes(data, 'little')
+        squares = []
+        for _ in range(ROWS * COLS):
+            square_code = code & 7
+            if square_code and square_code not in CODE_SQUARES:
+                raise ValueError(f"bad square code {square_code}")
+            squares.append(CODE_SQUARES.get(square_code))
+            code >>= 3
+        if code > 1:
+            raise ValueError("unused bits set")
+        return cls._from_squares(squares, RED if code else WHITE)
+
+    def to_fen(self, turn):
+        """Position as a FEN-like string (see FEN_PIECES) with turn to move; turn is required as for to_bytes."""
+        rows = []
+        for row in self.board:
+            text, empty = '', 0
+            for piece in row:
+                if piece == 0:
+                    empty += 1
+                    continue
+                if empty:
+                    text += str(empty)
+                    empty = 0
+                text += PIECE_FEN[piece.color, piece.type]
+            rows.append(text + (str(empty) if empty else ''))
+        return '/'.join(rows) + (' r' if turn == RED else ' w')
+
+    @classmethod
+    def from_fen(cls, fen):
+        try:
+            placement, side = fen.split()
+            turn = FEN_SIDES[side]
+        except (ValueError, KeyError):
+            raise ValueError(f"bad FEN {fen!r}: expected '<rows> w' or '<rows> r'")
+        rows = placement.split('/')
+        if len(rows) != ROWS:
+            raise ValueError(f"bad FEN {fen!r}: expected {ROWS} rows")
+        squares = []
+        for text in rows:
+            row = []
+            for char in text:
+                if char.isdigit():
+                    row.extend([None] * int(char))
+                elif char in FEN_PIECES:
+                    row.append(FEN_PIECES[char])
+                else:
+                    raise ValueError(f"bad FEN {fen!r}: unknown piece {char!r}")
+            if len(row) != COLS:
+                raise ValueError(f"bad FEN {fen!r}: row {text!r} is not {COLS} squares")
+            squares.extend(row)
+        return cls._from_squares(squares, turn)
+
+    @classmethod
+    def _from_squares(cls, squares, turn):
+        # Board from ROWS * COLS (color, type) or None entries, without building the start position first.
+        # The promotion counters (red_kings/white_kings) are history, not position, and start at 0.
+        board = cls.__new__(cls)
+        board.board = []
+        board.red_left = board.white_left = board.red_kings = board.white_kings = 0
+        board.turn = turn
+        for row in range(ROWS):
+            board.board.append([])
+            for col in range(COLS):
+                square = squares[row * COLS + col]
+                if square is None:
+                    board.board[row].append(0)
+                    continue
+                color, type = square
+                board.board[row].append(Piece(row, col, type, color))
+                if color == WHITE:
+                    board.white_left += 1
+                else:
+                    board.red_left += 1
+        board.hash = hash_board(board)
+        board.material = board.count_material()
+        return board
+
     def get_valid_moves(self, piece):
         moves = {}
         row, col = piece.row, piece.col
 
-        if piece.type == 'soldier':
+        if piece.type == SOLDIER:
             if piece.color == RED:
                 moves.update(self._get_moves(row - 1, col, -1, piece.color))
             else:
                 moves.update(self._get_moves(row + 1, col, 1, piece.color))
-        elif piece.type == 'queen':
+        elif piece.type == QUEEN:
             moves.update(self._get_moves(row, col - 1, 0, piece.color))  # left
             moves.update(self._get_moves(row, col + 1, 0, piece.color))  # right
             if piece.color == RED:
                moves.update(self._get_moves(row - 1, col, 0, piece.color))  # up
             else:
                moves.update(self._get_moves(row + 1, col, 0, piece.color))  # down
-        elif piece.type == 'king':
+        elif piece.type == KING:
             moves.update(self._get_moves(row - 1, col, 0, piece.color))  # up
             moves.update(self._get_moves(row + 1, col, 0, piece.color))  # down
             moves.update(self._get_moves(row, col - 1, 0, piece.color))  # left
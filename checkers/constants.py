@@ -1,18 +1,32 @@
-import pygame
-
 WIDTH, HEIGHT = 800, 800
 ROWS, COLS = 9, 9
 SQUARE_SIZE = WIDTH // COLS
 
+# Sides (piece.color, Board.turn) and piece types (piece.type) as small ints;
+# 0 stays free for an empty square
+WHITE, RED = 1, 2
+SOLDIER, QUEEN, KING = 1, 2, 3
+
 # RGB Colors
-RED = (255, 0, 0)
-WHITE = (255, 255, 255)
+RED_RGB = (255, 0, 0)
+WHITE_RGB = (255, 255, 255)
 BLACK = (0, 0, 0)
 BLUE = (0, 0, 255)
 GREY = (128, 128, 128)
+# Drawing color of each side's pieces
+SIDE_RGB = {WHITE: WHITE_RGB, RED: RED_RGB}
+
+# Material weights used by Board.evaluate
+PIECE_VALUES = {SOLDIER: 1, QUEEN: 3, KING: 5}
 
-# Loading piece images
-crown = pygame.transform.scale(pygame.image.load('crown.png'), (SQUARE_SIZE - 10, SQUARE_SIZE - 10))
-KING = pygame.transform.scale(pygame.image.load('king.png'), (SQUARE_SIZE - 10, SQUARE_SIZE - 10))
-QUEEN = pygame.transform.scale(pygame.image.load('queen.png'), (SQUARE_SIZE - 10, SQUARE_SIZE - 10))
-SOLDIER = pygame.transform.scale(pygame.image.load('soldier.png'), (SQUARE_SIZE - 10, SQUARE_SIZE - 10))
\ No newline at end of file
+# (row step, col step) each piece may take, mirroring Board.get_valid_moves
+ORTHOGONAL = ((-1, 0), (1, 0), (0, -1), (0, 1))
+DIAGONAL = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+DIRECTIONS = {
+    (WHITE, SOLDIER): ((1, 0),),
+    (RED, SOLDIER): ((-1, 0),),
+    (WHITE, QUEEN): ((0, -1), (0, 1), (1, 0)),
+    (RED, QUEEN): ((0, -1), (0, 1), (-1, 0)),
+    (WHITE, KING): ORTHOGONAL + DIAGONAL,
+    (RED, KING): ORTHOGONAL + DIAGONAL,
+}
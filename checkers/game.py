@@ -1,30 +1,41 @@
+import time
 import pygame
 from pygame.locals import *
+from . import assets
 from .board import Board
-from .constants import RED, WHITE, BLUE, SQUARE_SIZE, GREY
+from .constants import RED, WHITE
+from .render import BoardRenderer
 from minimax.fuzzy import calculate_fuzzy_move,determine_best_fuzzy_move
 
 pygame.init()
 pygame.mixer.init()
-select_sound = pygame.mixer.Sound("mouse-click-104737.mp3")
+SELECT_SOUND = "mouse-click-104737.mp3"
+CAPTURE_SOUND = "pick-92276.mp3"
 
 class Game:
-    def __init__(self, win):
+    def __init__(self, win, log=None):
         self._init()
         self.win = win
+        self.renderer = BoardRenderer(win)
+        # Optional minimax.gamelog.GameLog that every move is written to
+        self.log = log
 
     def update(self):
-        self.board.draw(self.win)
-        self.draw_valid_moves(self.valid_moves)
-        pygame.display.update()
+        # Repaints and flips only the squares that changed since the last frame
+        self.renderer.draw(self.board, self.valid_moves)
 
     def _init(self):
         self.selected = None
         self.board = Board()
         self.turn = RED
         self.valid_moves = {}
+        self.turn_started = time.perf_counter()
+        # Set to the side to move when it has no legal move, which loses the game
+        self.stuck = None
 
     def winner(self):
+        if self.stuck is not None:
+            return "RED" if self.stuck == WHITE else "WHITE"
         if self.board.winner() == WHITE:
             return "WHITE"
         elif self.board.winner() == RED:
@@ -37,7 +48,7 @@ class Game:
         self._init()
 
     def select(self, row, col):
-        select_sound.play()
+        assets.sound(SELECT_SOUND).play()
         if self.selected:
             result = self._move(row, col)
             if not result:
@@ -56,30 +67,41 @@ class Game:
         piece = self.board.get_piece(row, col)
         if self.selected and (row, col) in self.valid_moves:
             target = self.board.get_piece(row, col)
+            if self.log:
+                self.log.move((self.selected.row, self.selected.col, row, col), self.turn, 'human',
+                              time.perf_counter() - self.turn_started)
             if target != 0 and target.color != self.selected.color:
               self.board.remove([target])
+              assets.sound(CAPTURE_SOUND).play()
             self.board.move(self.selected, row, col)
             self.change_turn()
         else:
             return False
         return True
 
-    def draw_valid_moves(self, moves):
-        for move in moves:
-            row, col = move
-            pygame.draw.circle(self.win, BLUE, (col * SQUARE_SIZE + SQUARE_SIZE // 2, row * SQUARE_SIZE + SQUARE_SIZE // 2), 15)
-
     def change_turn(self):
         self.valid_moves = {}
+        self.turn_started = time.perf_counter()
         if self.turn == RED:
             self.turn = WHITE
         else:
             self.turn = RED
+        if self.board.winner() is None and not self.board.legal_moves(self.turn):
+            self.no_moves()
+
+    def no_moves(self):
+        # Same rule as minimax/arena.py: a side with no legal move loses
+        self.stuck = self.turn
     
     def get_board(self):
         return self.board
 
-    def ai_move(self, board):
+    def ai_move(self, board, move=None, engine=None, seconds=0.0, nodes=None):
+        # The engines search silently, so the capture sound is played here
+        if self.log and move is not None:
+            self.log.move(move, self.turn, engine, seconds, nodes)
+        if board.red_left < self.board.red_left or board.white_left < self.board.white_left:
+            assets.sound(CAPTURE_SOUND).play()
         self.board = board
         self.change_turn()
 
@@ -88,5 +110,4 @@ class Game:
     def ai_fuzzy_move(self):
         new_board = determine_best_fuzzy_move(self.board)
         if new_board:
-            self.board = new_board
-            self.change_turn()
\ No newline at end of file
+            self.ai_move(new_board)
\ No newline at end of file
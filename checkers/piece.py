@@ -1,9 +1,8 @@
-import pygame
-from .constants import RED, WHITE, SQUARE_SIZE, GREY, KING, QUEEN, SOLDIER
+from .constants import KING
 
 class Piece:
-    PADDING = 15
-    OUTLINE = 2
+    # Slots keep pieces small and cheap to copy; color and type are the ints from constants
+    __slots__ = ('row', 'col', 'color', 'king', 'type')
 
     def __init__(self, row, col, type, color):
         self.row = row
@@ -12,34 +11,20 @@ class Piece:
         self.king = False
         self.type = type
 
-        self.x = 0
-        self.y = 0
-        self.calc_pos()
+    def __deepcopy__(self, memo):
+        piece = Piece.__new__(Piece)
+        piece.row, piece.col, piece.color, piece.king, piece.type = self.row, self.col, self.color, self.king, self.type
+        memo[id(self)] = piece
+        return piece
 
-    def calc_pos(self):
-        self.x = SQUARE_SIZE * self.col + SQUARE_SIZE // 2
-        self.y = SQUARE_SIZE * self.row + SQUARE_SIZE // 2
-    
     def make_king(self):
         self.king = True
-        self.type = 'king'
-    
-    def draw(self, win):
-        if self.type == 'king':
-            image = KING
-        elif self.type == 'queen':
-            image = QUEEN
-        else:
-            image = SOLDIER
-        radius = SQUARE_SIZE // 2 - self.PADDING
-        pygame.draw.circle(win, GREY, (self.x, self.y), radius + self.OUTLINE)
-        pygame.draw.circle(win, self.color, (self.x, self.y), radius)
-        win.blit(image, (self.x - image.get_width() // 2, self.y - image.get_height() // 2))
+        self.type = KING
 
     def move(self, row, col):
+        # Screen coordinates are worked out when the piece is drawn, not here
         self.row = row
         self.col = col
-        self.calc_pos()
-    
+
     def _repr_(self):
-        return str(self.color)
\ No newline at end of file
+        return str(self.color)
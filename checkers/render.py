@@ -0,0 +1,102 @@
+import pygame
+from . import assets
+from .constants import BLACK, BLUE, ROWS, COLS, SQUARE_SIZE, WHITE_RGB, GREY, SIDE_RGB, SOLDIER, QUEEN, KING
+
+# Drawing lives here so the rules and search modules never import pygame
+PADDING = 15
+OUTLINE = 2
+DOT_RADIUS = 15
+
+# Piece images, loaded through the asset cache the first time a piece is drawn
+PIECE_FILES = {KING: 'king.png', QUEEN: 'queen.png', SOLDIER: 'soldier.png'}
+PIECE_IMAGE_SIZE = (SQUARE_SIZE - 10, SQUARE_SIZE - 10)
+
+
+def draw_cubes(win):
+    win.fill(BLACK)
+    for row in range(ROWS):
+        for col in range(row % 2, ROWS, 2):
+            pygame.draw.rect(win, WHITE_RGB, (row * SQUARE_SIZE, col * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+
+
+def piece_center(piece):
+    # Pixel centre of the piece's square
+    return SQUARE_SIZE * piece.col + SQUARE_SIZE // 2, SQUARE_SIZE * piece.row + SQUARE_SIZE // 2
+
+
+def draw_piece(win, piece):
+    image = assets.image(PIECE_FILES[piece.type], PIECE_IMAGE_SIZE)
+    radius = SQUARE_SIZE // 2 - PADDING
+    x, y = piece_center(piece)
+    pygame.draw.circle(win, GREY, (x, y), radius + OUTLINE)
+    pygame.draw.circle(win, SIDE_RGB[piece.color], (x, y), radius)
+    win.blit(image, (x - image.get_width() // 2, y - image.get_height() // 2))
+
+
+def draw_board(win, board):
+    draw_cubes(win)
+    for row in range(ROWS):
+        for col in range(COLS):
+            piece = board.board[row][col]
+            if piece != 0:
+                draw_piece(win, piece)
+
+
+def square_rect(row, col):
+    return pygame.Rect(col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+
+
+def draw_square(win, row, col):
+    # Same pattern as draw_cubes: light squares where row + col is even
+    win.fill(WHITE_RGB if (row + col) % 2 == 0 else BLACK, square_rect(row, col))
+
+
+def draw_valid_move(win, row, col):
+    pygame.draw.circle(win, BLUE, (col * SQUARE_SIZE + SQUARE_SIZE // 2, row * SQUARE_SIZE + SQUARE_SIZE // 2),
+                       DOT_RADIUS)
+
+
+class BoardRenderer:
+    """Draws a board and its valid-move dots, repainting only squares that changed.
+
+    Each frame the (color, type, dot) content of every square is compared
+    with what was last drawn; changed squares are repainted and only their
+    rectangles are passed to pygame.display.update. An unchanged board
+    costs no drawing at all.
+    """
+
+    def __init__(self, win):
+        self.win = win
+        self.drawn = None
+
+    def invalidate(self):
+        # Repaint everything next frame, e.g. after something else drew over the window
+        self.drawn = None
+
+    def draw(self, board, valid_moves):
+        cells = []
+        for row in range(ROWS):
+            for col in range(COLS):
+                piece = board.board[row][col]
+                dot = (row, col) in valid_moves
+                cells.append((piece.color, piece.type, dot) if piece != 0 else (0, 0, dot))
+
+        if self.drawn is None:
+            draw_board(self.win, board)
+            for row, col in valid_moves:
+                draw_valid_move(self.win, row, col)
+            pygame.display.update()
+        else:
+            dirty = []
+            for index, cell in enumerate(cells):
+                if cell != self.drawn[index]:
+                    row, col = divmod(index, COLS)
+                    draw_square(self.win, row, col)
+                    if cell[0]:
+                        draw_piece(self.win, board.board[row][col])
+                    if cell[2]:
+                        draw_valid_move(self.win, row, col)
+                    dirty.append(square_rect(row, col))
+            if dirty:
+                pygame.display.update(dirty)
+        self.drawn = cells
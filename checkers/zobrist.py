@@ -0,0 +1,28 @@
+import random
+from .constants import ROWS, COLS, RED, WHITE, SOLDIER, QUEEN, KING
+
+# Fixed seed so a position hashes the same way in every run and process
+_random = random.Random(0x9C4E55)
+
+# ZOBRIST[(color, type)][row * COLS + col] -> 64-bit key
+ZOBRIST = {
+    (color, piece_type): [_random.getrandbits(64) for _ in range(ROWS * COLS)]
+    for color in (WHITE, RED)
+    for piece_type in (SOLDIER, QUEEN, KING)
+}
+# XORed in when RED (the minimizing side) is to move
+SIDE_KEY = _random.getrandbits(64)
+
+
+def piece_key(piece):
+    return ZOBRIST[(piece.color, piece.type)][piece.row * COLS + piece.col]
+
+
+def hash_board(board):
+    """Full Zobrist hash of a Board; Board keeps it up to date incrementally afterwards."""
+    value = 0
+    for row in board.board:
+        for piece in row:
+            if piece != 0:
+                value ^= piece_key(piece)
+    return value
@@ -1,14 +1,23 @@
+import time
 import pygame
 from pygame.locals import *
 from checkers.constants import WIDTH, HEIGHT, SQUARE_SIZE, RED, WHITE, BLUE
+from checkers import assets
 from checkers.game import Game
+from checkers.animation import get_animation
 from minimax.algo import minimax
-from minimax.algorithm import alpha_beta_minimax
-from minimax.genetic_algorithm import genetic_algorithm, get_optimized_evaluation_function
+from minimax.algorithm import iterative_deepening
+from minimax.book import OpeningBook
+from minimax.gamelog import GameLog, find_move
+from minimax.stats import SearchStats
+from minimax.tablebase import Tablebase
+from minimax.genetic_algorithm import get_optimized_evaluation_function, load_params
+from minimax.engines import DEFAULT_PARAMS
 from minimax.ga_minimax import GA_minimax
-from PIL import Image
-import imageio
-import numpy as np
+from minimax.transposition import TranspositionTable
+from minimax.ordering import MoveOrderer
+from minimax.worker import SearchWorker, PENDING
+from minimax.fuzzy import determine_best_fuzzy_move
 
 # Constants
 FPS = 60
@@ -18,6 +27,12 @@ BUTTON_COLOR = (255, 150, 50)
 BUTTON_HOVER_COLOR = (255, 255, 102)
 TEXT_COLOR = (0, 0, 0)
 SHADOW_COLOR = (100, 100, 100)
+AI_TIME_BUDGET = 0.5  # Seconds the Hard AI may think per move
+OPENING_BOOK = OpeningBook()  # Built with `python -m minimax.book`
+TABLEBASE = Tablebase()  # Built with `python -m minimax.tablebase`
+CACHE_ANIMATIONS_ON_DISK = False  # Keep decoded win/lose frames in .atlas files next to the GIFs
+GAME_LOG = GameLog()  # Every game is appended to games.jsonl; replay it with `python -m minimax.gamelog`
+LOG_GAMES = True
 
 pygame.init()
 WIN = pygame.display.set_mode((WIDTH, HEIGHT))
@@ -26,9 +41,9 @@ BUTTON_FONT = pygame.font.SysFont("comicsans", 40)
 TITLE_FONT = pygame.font.SysFont("comicsans", 50)
 BUTTON_WIDTH, BUTTON_HEIGHT = 200, 80
 
-background_image = pygame.transform.scale(pygame.image.load('background.jpg'), (WIDTH, HEIGHT))
-
-click_sound = pygame.mixer.Sound("lclick-13694.mp3")
+BACKGROUND_IMAGE = 'background.jpg'
+CLICK_SOUND = "lclick-13694.mp3"
+REPORT_ASSET_LOADS = False  # Print how long each image and sound took to load on exit
 
 
 def get_row_col_from_mouse(pos):
@@ -55,7 +70,7 @@ def draw_button(button_rect, text, hover):
 
 
 def draw_opening_screen():
-    WIN.blit(background_image, (0, 0))
+    WIN.blit(assets.image(BACKGROUND_IMAGE, (WIDTH, HEIGHT)), (0, 0))
     start_button_rect = pygame.Rect(WIDTH // 2 - BUTTON_WIDTH // 2, HEIGHT - BUTTON_HEIGHT - 50, BUTTON_WIDTH, BUTTON_HEIGHT)
     draw_button(start_button_rect, 'Start', False)
     pygame.display.update()
@@ -136,20 +151,6 @@ def draw_instructions_screen():
 
 
 
-def load_gif(filename):
-    gif = imageio.get_reader(filename)
-    return [np.array(frame) for frame in gif]
-
-def resize_gif_frames(gif_frames, new_size=(WIDTH, HEIGHT)):
-    resized_frames = []
-    for frame in gif_frames:
-        pil_image = Image.fromarray(frame)
-        pil_image = pil_image.resize(new_size, resample=Image.BILINEAR)
-        pygame_image = pygame.image.fromstring(pil_image.tobytes(), pil_image.size, pil_image.mode)
-        resized_frames.append(pygame_image)
-    return resized_frames
-
-
 def draw_winner_screen(winner, gif_filename_win, gif_filename_lose):
     WIN.fill(BACKGROUND_COLORR)
     
@@ -164,8 +165,9 @@ def draw_winner_screen(winner, gif_filename_win, gif_filename_lose):
         gif_filename = None
 
     if gif_filename:
-        gif_frames = resize_gif_frames(load_gif(gif_filename), (WIDTH, HEIGHT))
-        frame_index, num_frames, clock, running = 0, len(gif_frames), pygame.time.Clock(), True
+        # Frames stream in on a background thread and stay cached for the next game over
+        animation = get_animation(assets.asset_path(gif_filename), (WIDTH, HEIGHT), CACHE_ANIMATIONS_ON_DISK)
+        frame_index, clock, running = 0, pygame.time.Clock(), True
 
         # Define play_again_button_rect before the loop
         play_again_button_rect = pygame.Rect(WIDTH // 2 - BUTTON_WIDTH // 2, HEIGHT - BUTTON_HEIGHT - 50, BUTTON_WIDTH, BUTTON_HEIGHT)
@@ -179,11 +181,13 @@ def draw_winner_screen(winner, gif_filename_win, gif_filename_lose):
                     if play_again_button_rect.collidepoint(pos):
                         return 'opening'
 
-            WIN.blit(gif_frames[frame_index], (0, HEIGHT // 50))
+            frame = animation.frame(frame_index)
+            if frame is not None:
+                WIN.blit(frame, (0, HEIGHT // 50))
             draw_text_center(winner_text, TITLE_FONT, TEXT_COLOR, WIN, (WIDTH // 2, HEIGHT // 10), shadow=True)
             draw_button(play_again_button_rect, 'Play Again', False)
             pygame.display.flip()
-            frame_index = (frame_index + 1) % num_frames
+            frame_index = animation.next_index(frame_index)
             clock.tick(12)
         pygame.display.update()    
         
@@ -216,19 +220,19 @@ def main():
             elif event.type == MOUSEBUTTONDOWN:
                 pos = pygame.mouse.get_pos()
                 if screen_state == 'opening' and button_rect.collidepoint(pos):
-                    click_sound.play()  # Play sound on button click
+                    assets.sound(CLICK_SOUND).play()  # Play sound on button click
                     screen_state = 'difficulty'
                 elif screen_state == 'difficulty_screen':
                     for button_rect, text in buttons:
                         if button_rect.collidepoint(pos):
-                            click_sound.play()  # Play sound on button click
+                            assets.sound(CLICK_SOUND).play()  # Play sound on button click
                             game_loop(text)
                             screen_state = 'opening'
                     if how_to_play_button_rect.collidepoint(pos):
-                        click_sound.play()  # Play sound on button click
+                        assets.sound(CLICK_SOUND).play()  # Play sound on button click
                         screen_state = 'instructions'
                 elif screen_state == 'instructions' and close_button_rect.collidepoint(pos):
-                    click_sound.play()  # Play sound on button click
+                    assets.sound(CLICK_SOUND).play()  # Play sound on button click
                     screen_state = 'difficulty'
 
         if screen_state == 'difficulty_screen':
@@ -237,23 +241,72 @@ def main():
 
         pygame.display.update()
 
+    if REPORT_ASSET_LOADS:
+        assets.report()
     pygame.quit()
     return 'opening'
 
+def ai_search(board, difficulty, evaluation_function, transposition_table, move_orderer, stop=None):
+    # Runs on the SearchWorker thread and returns the board after the AI's move with its game log details
+    start = time.perf_counter()
+    stats = SearchStats()
+    if difficulty == 'Easy':
+        print("using hybrid genetic and minimax algorithm")
+        engine = 'ga_minimax'
+        value, new_board = GA_minimax(board, 4, float('-inf'), float('inf'), True, None, evaluation_function,
+                                      stop=stop, stats=stats)
+    elif difficulty == 'Medium':
+        print("using minimax")
+        engine = 'minimax'
+        value, new_board = minimax(board, 2, True, None, stop=stop, stats=stats)
+    elif difficulty == 'Hard':
+        book_move = OPENING_BOOK.probe(board, WHITE)
+        if book_move is not None:
+            print("using opening book")
+            engine = 'book'
+            new_board = board.child(book_move)
+        else:
+            print("using alpha beta pruning")
+            engine = 'iterative'
+            value, new_board, depth = iterative_deepening(board, AI_TIME_BUDGET, True, tt=transposition_table,
+                                                          orderer=move_orderer, stop=stop, tablebase=TABLEBASE,
+                                                          stats=stats)
+            print(f"searched to depth {depth}, first move cutoffs {move_orderer.first_move_cutoff_rate():.0%}")
+            print(f"transposition table: {transposition_table.hits} hits, {transposition_table.misses} misses")
+    else:
+        print("using fuzzy")
+        engine = 'fuzzy'
+        new_board = determine_best_fuzzy_move(board)
+
+    move = find_move(board, new_board, WHITE) if new_board is not None else None
+    if stats.nodes:
+        print(stats.summary())
+    details = {'move': move, 'engine': engine, 'seconds': time.perf_counter() - start, 'nodes': stats.nodes}
+    return new_board, details
+
 def game_loop(difficulty):
     run = True
     clock = pygame.time.Clock()
-    game = Game(WIN)
+    game = Game(WIN, GAME_LOG if LOG_GAMES else None)
+    if LOG_GAMES:
+        GAME_LOG.start_game(white=difficulty, red='human', board=game.board, turn=RED)
 
-    optimized_params = genetic_algorithm()  # Optimize evaluation function parameters
+    # Parameters tuned offline with `python -m minimax.genetic_algorithm`; defaults until then
+    optimized_params = load_params() or DEFAULT_PARAMS
     optimized_evaluation_function = get_optimized_evaluation_function(optimized_params)
+    transposition_table = TranspositionTable()
+    move_orderer = MoveOrderer()
+    search_worker = SearchWorker()
 
     while run:
         clock.tick(FPS)
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                search_worker.cancel()
                 run = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                game.renderer.invalidate()
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if game.turn == RED:  # Player's turn
                     pos = pygame.mouse.get_pos()
@@ -261,6 +314,7 @@ def game_loop(difficulty):
                     print(f"Mouse clicked at ({row}, {col})")
                     game.select(row, col)
                     if game.winner() is not None:
+                        GAME_LOG.end_game(WHITE if game.winner() == "WHITE" else RED)
                         if game.winner() == "WHITE":
                             
                             draw_winner_screen("WHITE", "win.gif", "lose.gif")
@@ -271,28 +325,26 @@ def game_loop(difficulty):
                             
                         
                         pygame.time.delay(2000)
+                        search_worker.cancel()
                         game.reset()  # Reset the game after displaying winner
                         return 'opening'  # Continue to next iteration of the loop
 
         if game.turn == WHITE and game.winner() is None:
-            print("AI's Turn")
-            if difficulty == 'Easy':
-                print("using hybrid genetic and minimax algorithm")
-                value, new_board = GA_minimax(game.get_board(), 4, True, float('-inf'), float('inf'), game, optimized_evaluation_function)
-                game.ai_move(new_board)
-            elif difficulty == 'Medium':
-                print("using minimax")
-                value, new_board = minimax(game.get_board(), 2, True, game)
-                game.ai_move(new_board)
-            elif difficulty == 'Hard':
-                print("using alpha beta pruning")
-                value, new_board = alpha_beta_minimax(game.get_board(), 3, float('-inf'), float('inf'), True, game)
-                game.ai_move(new_board)
-            elif difficulty == 'Very Hard':
-                print("using fuzzy")
-                game.ai_fuzzy_move()
+            # The search runs on a worker thread; the window keeps redrawing meanwhile
+            result = search_worker.poll()
+            if result is not PENDING:
+                new_board, details = result
+                if new_board is not None:
+                    game.ai_move(new_board, **details)
+                else:
+                    game.no_moves()
+            elif not search_worker.busy():
+                print("AI's Turn")
+                search_worker.start(ai_search, game.get_board(), difficulty, optimized_evaluation_function,
+                                    transposition_table, move_orderer)
                 
         if game.winner():
+            GAME_LOG.end_game(WHITE if game.winner() == "WHITE" else RED)
             if game.winner() == "WHITE":
                             
                 draw_winner_screen("WHITE", "win.gif", "lose.gif")
@@ -306,9 +358,7 @@ def game_loop(difficulty):
             return 'opening'
             
         
-        game.update()  # Update the game state and display
-        game.draw_valid_moves(game.valid_moves)
-        pygame.display.update()  # Update the display
+        game.update()  # Redraws and flips only the squares that changed
 
     main()
 
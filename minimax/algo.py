@@ -1,19 +1,43 @@
-from copy import deepcopy
-#deepcopy will copy not only the reference but also the object itself
-import pygame
+from checkers.bitboard import BitBoard
+from checkers.constants import RED, WHITE
+from minimax.algorithm import SearchAborted
 
-RED = (255,0,0)
-WHITE = (255, 255, 255)
-
-def minimax(position, depth, max_player, game):
+def minimax(position, depth, max_player, game, bitboard=False, stop=None, stats=None):
     if depth == 0 or position.winner() != None:
         return position.evaluate(), position
-    
+
+    search_position = BitBoard.from_board(position) if bitboard else position
+    if stats is not None:
+        stats.begin_depth()
+    evaluation, move = minimax_search(search_position, depth, max_player, stop, stats)
+    if stats is not None:
+        stats.end_depth(depth)
+    return evaluation, position.child(move) if move is not None else None
+
+
+def minimax_search(position, depth, max_player, stop=None, stats=None, ply=0):
+    if stop is not None and stop.is_set():
+        raise SearchAborted
+    if stats is not None:
+        stats.node(ply)
+    if depth == 0 or position.winner() != None:
+        if stats is not None:
+            return stats.evaluate(position), None
+        return position.evaluate(), None
+
+    moves = get_all_moves(position, WHITE if max_player else RED)
+    if stats is not None:
+        moves = stats.timed_moves(moves)
+
     if max_player:
         maxEval = float('-inf')
         best_move = None
-        for move in get_all_moves(position, WHITE, game):
-            evaluation = minimax(move, depth-1, False, game)[0]
+        for move in moves:
+            undo = position.make_move(move)
+            try:
+                evaluation = minimax_search(position, depth-1, False, stop, stats, ply + 1)[0]
+            finally:
+                position.unmake_move(undo)
             maxEval = max(maxEval, evaluation)
             if maxEval == evaluation:
                 best_move = move
@@ -22,8 +46,12 @@ def minimax(position, depth, max_player, game):
     else:
         minEval = float('inf')
         best_move = None
-        for move in get_all_moves(position, RED, game):
-            evaluation = minimax(move, depth-1, True, game)[0]
+        for move in moves:
+            undo = position.make_move(move)
+            try:
+                evaluation = minimax_search(position, depth-1, True, stop, stats, ply + 1)[0]
+            finally:
+                position.unmake_move(undo)
             minEval = min(minEval, evaluation)
             if minEval == evaluation:
                 best_move = move
@@ -31,36 +59,6 @@ def minimax(position, depth, max_player, game):
         return minEval, best_move
 
 
-def simulate_move(piece, move, board, game, skip):
-
-    if piece:
-        if skip:
-            for skipped_piece in skip:
-                board.remove([skipped_piece])
-        board.move(piece, move[0], move[1])
-    return board
-
-
-def get_all_moves(board, color, game):
-    moves = []
-
-    for piece in board.get_all_pieces(color):
-        valid_moves = board.get_valid_moves(piece)
-        for move, skip in valid_moves.items():
-            #draw_moves(game, board, piece)
-            temp_board = deepcopy(board)
-            temp_piece = temp_board.get_piece(piece.row, piece.col)
-            new_board = simulate_move(temp_piece, move, temp_board, game, skip)
-            moves.append(new_board)
-    
-    return moves
-
-
-#def draw_moves(game, board, piece):
-    #valid_moves = board.get_valid_moves(piece)
-    #board.draw(game.win)
-    #pygame.draw.circle(game.win, (0,255,0), (piece.x, piece.y), 50, 5)
-    #game.draw_valid_moves(valid_moves.keys())
-    #pygame.display.update()
-    #pygame.time.delay(100)
-    
\ No newline at end of file
+def get_all_moves(board, color):
+    # A generator: moves are only produced as the search asks for them
+    return board.generate_moves(color)
@@ -1,60 +1,200 @@
-from copy import deepcopy
-RED = (255, 0, 0)
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-BLUE = (0, 0, 255)
-GREY = (128, 128, 128)
-
-def alpha_beta_minimax(position, depth, alpha, beta, max_player, game):
+import time
+from checkers.bitboard import BitBoard
+from checkers.constants import RED, WHITE
+from minimax.transposition import TranspositionTable, EXACT, LOWER, UPPER
+from minimax.ordering import MoveOrderer
+
+
+class SearchAborted(Exception):
+    """Raised inside a search once its deadline has passed or it was cancelled."""
+
+def alpha_beta_minimax(position, depth, alpha, beta, max_player, game, bitboard=False, tt=None, orderer=None,
+                       stop=None, tablebase=None, stats=None):
     if depth == 0 or position.winner() is not None:
         return position.evaluate(), position
-    
+
+    search_position = BitBoard.from_board(position) if bitboard else position
+    if tt is not None:
+        tt.new_search()
+    if orderer is None:
+        orderer = MoveOrderer()
+    orderer.new_search()
+    if stats is not None:
+        stats.begin_depth()
+    evaluation, move = alpha_beta_search(search_position, depth, alpha, beta, max_player, tt, orderer=orderer,
+                                         stop=stop, tablebase=tablebase, stats=stats)
+    if stats is not None:
+        stats.end_depth(depth)
+    return evaluation, position.child(move) if move is not None else None
+
+def iterative_deepening(position, time_budget=0.5, max_player=True, max_depth=32, tt=None, bitboard=False,
+                        orderer=None, stop=None, tablebase=None, stats=None):
+    """Search depth 1, 2, 3... until time_budget seconds are used up.
+
+    Returns (evaluation, new_board, depth) from the deepest search that
+    finished. Depth 1 always runs to completion so there is a move to play,
+    unless the search is cancelled through stop.
+    """
+    if position.winner() is not None:
+        return position.evaluate(), position, 0
+
+    search_position = BitBoard.from_board(position) if bitboard else position
+    evaluation, move, completed = iterative_deepening_search(search_position, time_budget, max_player, max_depth,
+                                                             tt, orderer, stop, tablebase, stats)
+    return evaluation, position.child(move) if move is not None else None, completed
+
+def iterative_deepening_search(position, time_budget=0.5, max_player=True, max_depth=32, tt=None, orderer=None,
+                               stop=None, tablebase=None, stats=None):
+    # Same as iterative_deepening but returns (evaluation, move, depth) and leaves the board alone
+    if tablebase is not None:
+        # A covered endgame needs no search at all
+        result = tablebase.best_move(position, WHITE if max_player else RED)
+        if result is not None:
+            return result[0], result[1], 0
+    if tt is None:
+        tt = TranspositionTable()
+    tt.new_search()
+    if orderer is None:
+        orderer = MoveOrderer()
+    orderer.new_search()
+    deadline = time.perf_counter() + time_budget
+    if stats is not None:
+        stats.begin_depth()
+    evaluation, move = alpha_beta_search(position, 1, float('-inf'), float('inf'), max_player, tt,
+                                         orderer=orderer, stop=stop, tablebase=tablebase, stats=stats)
+    if stats is not None:
+        stats.end_depth(1)
+    completed = 1
+    for depth in range(2, max_depth + 1):
+        if stats is not None:
+            stats.begin_depth()
+        try:
+            result = alpha_beta_search(position, depth, float('-inf'), float('inf'), max_player, tt,
+                                       deadline=deadline, orderer=orderer, stop=stop, tablebase=tablebase,
+                                       stats=stats)
+        except SearchAborted:
+            if stats is not None:
+                stats.end_depth(depth, completed=False)
+            if stop is not None and stop.is_set():
+                raise
+            break
+        if stats is not None:
+            stats.end_depth(depth)
+        evaluation, move = result
+        completed = depth
+    return evaluation, move, completed
+
+def alpha_beta_search(position, depth, alpha, beta, max_player, tt=None, ply=0, deadline=None, orderer=None,
+                      stop=None, tablebase=None, stats=None):
+    # Like minimax_search and GA_minimax_search: searches in place with make_move/unmake_move and
+    # returns (evaluation, move). position may be a Board or a BitBoard, whose moves apply to the
+    # Board unchanged. A passed deadline or a set stop event raises SearchAborted
+    if deadline is not None and time.perf_counter() > deadline:
+        raise SearchAborted
+    if stop is not None and stop.is_set():
+        raise SearchAborted
+    if stats is not None:
+        stats.node(ply)
+    color = WHITE if max_player else RED
+    if tablebase is not None:
+        # Positions the tablebase covers are looked up rather than searched
+        if ply == 0:
+            result = tablebase.best_move(position, color)
+            if result is not None:
+                return result
+        else:
+            score = tablebase.score(position, color, ply)
+            if score is not None:
+                return score, None
+    if depth == 0 or position.winner() is not None:
+        if stats is not None:
+            return stats.evaluate(position), None
+        return position.evaluate(), None
+
+    tt_move = None
+    if tt is not None:
+        key = tt.key(position, max_player)
+        alpha_orig, beta_orig = alpha, beta
+        entry = tt.probe(key)
+        if entry is not None:
+            _, entry_depth, flag, value, tt_move, _ = entry
+            # Never cut at the root: the caller needs a move, not just a score
+            if ply > 0 and entry_depth >= depth:
+                if flag == EXACT:
+                    return value, tt_move
+                elif flag == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if beta <= alpha:
+                    return value, tt_move
+    # Moves are generated lazily, so siblings of a cutoff are never built
+    if orderer is not None:
+        moves = orderer.ordered_moves(position, color, ply, tt_move)
+    else:
+        moves = get_all_moves(position, color, tt_move)
+    if stats is not None:
+        moves = stats.timed_moves(moves)
+
+    # Ties keep the earlier move, which is the better ordered one
     if max_player:
         max_eval = float('-inf')
         best_move = None
-        for move in get_all_moves(position, WHITE, game):
-            evaluation, _ = alpha_beta_minimax(move, depth-1, alpha, beta, False, game)
-            max_eval = max(max_eval, evaluation)
-            if max_eval == evaluation:
+        for index, move in enumerate(moves):
+            undo = position.make_move(move)
+            try:
+                evaluation, _ = alpha_beta_search(position, depth-1, alpha, beta, False, tt, ply + 1, deadline,
+                                                  orderer, stop, tablebase, stats)
+            finally:
+                position.unmake_move(undo)
+            if best_move is None or evaluation > max_eval:
+                max_eval = evaluation
                 best_move = move
             alpha = max(alpha, max_eval)
             if beta <= alpha:
+                if orderer is not None:
+                    orderer.cutoff(move, ply, depth, index)
+                if stats is not None:
+                    stats.cutoff(ply)
                 break
-        return max_eval, best_move
+        best_eval = max_eval
     else:
         min_eval = float('inf')
         best_move = None
-        for move in get_all_moves(position, RED, game):
-            evaluation, _ = alpha_beta_minimax(move, depth-1, alpha, beta, True, game)
-            min_eval = min(min_eval, evaluation)
-            if min_eval == evaluation:
+        for index, move in enumerate(moves):
+            undo = position.make_move(move)
+            try:
+                evaluation, _ = alpha_beta_search(position, depth-1, alpha, beta, True, tt, ply + 1, deadline,
+                                                  orderer, stop, tablebase, stats)
+            finally:
+                position.unmake_move(undo)
+            if best_move is None or evaluation < min_eval:
+                min_eval = evaluation
                 best_move = move
             beta = min(beta, min_eval)
             if beta <= alpha:
+                if orderer is not None:
+                    orderer.cutoff(move, ply, depth, index)
+                if stats is not None:
+                    stats.cutoff(ply)
                 break
-        return min_eval, best_move
-
-def simulate_move(piece, move, board, game, skip):
-    # Ensure piece is a valid piece object
-    if piece:
-        if skip:
-            for skipped_piece in skip:
-                board.remove([skipped_piece])
-        board.move(piece, move[0], move[1])
-    return board
-
-
-def get_all_moves(board, color, game):
-    moves = []
-    for piece in board.get_all_pieces(color):
-        valid_moves = board.get_valid_moves(piece)
-        for move, skip in valid_moves.items():
-            # Create a deepcopy of the board to simulate the move
-            temp_board = deepcopy(board)
-            temp_piece = temp_board.get_piece(piece.row, piece.col)
-            new_board = simulate_move(temp_piece, move, temp_board, game, skip)
-            moves.append(new_board)
-            #print(f"Generated move: {move} for piece at {piece.row}, {piece.col}")
-    return moves
+        best_eval = min_eval
+
+    if tt is not None:
+        if best_eval <= alpha_orig:
+            flag = UPPER
+        elif best_eval >= beta_orig:
+            flag = LOWER
+        else:
+            flag = EXACT
+        tt.store(key, depth, flag, best_eval, best_move)
+    return best_eval, best_move
 
 
+def get_all_moves(board, color, tt_move=None):
+    # Lazily yields the hash move first (when it is legal here), then the rest
+    if tt_move is not None and board.is_legal(tt_move, color):
+        yield tt_move
+    for move in board.generate_moves(color):
+        if move != tt_move:
+            yield move
@@ -0,0 +1,144 @@
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from checkers.board import Board
+from checkers.constants import RED, WHITE
+from minimax.engines import ENGINES, get_engine, opponent
+from minimax.gamelog import GameLog, LOG_FILE
+from minimax.stats import SearchStats
+
+
+def engine_name(spec):
+    return spec if isinstance(spec, str) else getattr(spec, '__name__', type(spec).__name__)
+
+
+def play_game(white_spec, red_spec, max_moves=200, seed=None, log=None):
+    """Play one headless game and return its result and timings.
+
+    RED moves first, as in the pygame game. A side with no legal move
+    loses; reaching max_moves plies is a draw. Returns a dict with the
+    winner ('white', 'red' or None), the number of plies, the final
+    material balance (white minus red) and the total seconds and move
+    count of each side. With log set to a path, every move is appended to
+    that game log together with its search time and node count.
+    """
+    random.seed(seed)
+    engines = {WHITE: get_engine(white_spec), RED: get_engine(red_spec)}
+    seconds = {WHITE: 0.0, RED: 0.0}
+    moves = {WHITE: 0, RED: 0}
+    board = Board()
+    turn = RED
+    winner = None
+    game_log = None
+    if log:
+        game_log = GameLog(log)
+        game_log.start_game(engine_name(white_spec), engine_name(red_spec), board, turn)
+    for ply in range(max_moves):
+        winner = board.winner()
+        if winner is not None:
+            break
+        # Node counts for the log come from the search statistics; engines skip them otherwise
+        options = {'stats': SearchStats()} if game_log else {}
+        start = time.perf_counter()
+        move = engines[turn](board, turn, **options)
+        elapsed = time.perf_counter() - start
+        seconds[turn] += elapsed
+        moves[turn] += 1
+        if move is None:
+            winner = opponent(turn)
+            break
+        if game_log:
+            game_log.move(move, turn, engine_name(white_spec if turn == WHITE else red_spec), elapsed,
+                          options['stats'].nodes)
+        board.make_move(move)
+        turn = opponent(turn)
+    else:
+        winner = board.winner()
+        ply = max_moves
+    if game_log:
+        game_log.end_game(winner)
+        game_log.close()
+
+    return {
+        'winner': {WHITE: 'white', RED: 'red'}.get(winner),
+        'plies': ply,
+        'material': board.evaluate(),
+        'white_seconds': seconds[WHITE], 'white_moves': moves[WHITE],
+        'red_seconds': seconds[RED], 'red_moves': moves[RED],
+    }
+
+
+def _play_task(task):
+    return task, play_game(*task)
+
+
+def elo_difference(score):
+    # Elo gap implied by an expected score in (0, 1)
+    score = min(max(score, 1e-3), 1 - 1e-3)
+    return 400 * math.log10(score / (1 - score))
+
+
+def run_match(engine_a, engine_b, games=10, workers=None, max_moves=200, seed=0, log=None):
+    """Play `games` games between two engine specs across a process pool.
+
+    Colors alternate, engine_a taking WHITE in even games. Returns a summary
+    dict from engine_a's point of view. log is passed on to play_game.
+    """
+    tasks = []
+    for game in range(games):
+        white, red = (engine_a, engine_b) if game % 2 == 0 else (engine_b, engine_a)
+        tasks.append((white, red, max_moves, seed + game, log))
+
+    wins = draws = losses = 0
+    seconds = {engine_a: 0.0, engine_b: 0.0}
+    moves = {engine_a: 0, engine_b: 0}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        for game, ((white, red, *_), result) in enumerate(executor.map(_play_task, tasks)):
+            # From the game index, as above: comparing specs fails when an engine plays itself
+            a_color = 'white' if game % 2 == 0 else 'red'
+            if result['winner'] is None:
+                draws += 1
+            elif result['winner'] == a_color:
+                wins += 1
+            else:
+                losses += 1
+            for spec, color in ((white, 'white'), (red, 'red')):
+                # Both sides share a key when an engine plays itself
+                seconds[spec] += result[f'{color}_seconds']
+                moves[spec] += result[f'{color}_moves']
+    elapsed = time.perf_counter() - start
+
+    score = (wins + draws / 2) / games if games else 0.5
+    return {
+        'engine_a': engine_a, 'engine_b': engine_b, 'games': games,
+        'wins': wins, 'draws': draws, 'losses': losses,
+        'score': score, 'elo': elo_difference(score),
+        'ms_per_move': {spec: 1000 * seconds[spec] / moves[spec] if moves[spec] else 0.0 for spec in seconds},
+        'seconds': elapsed, 'games_per_second': games / elapsed if elapsed else 0.0,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Play engine-vs-engine games headlessly across a process pool')
+    parser.add_argument('engine_a', help=f"engine spec: name or name:setting, name one of {', '.join(ENGINES)}")
+    parser.add_argument('engine_b')
+    parser.add_argument('--games', type=int, default=10)
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
+    parser.add_argument('--max-moves', type=int, default=200, help='plies before a game is called a draw')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--log', nargs='?', const=LOG_FILE, default=None,
+                        help=f'append the games to a game log (default file: {LOG_FILE})')
+    args = parser.parse_args()
+
+    summary = run_match(args.engine_a, args.engine_b, args.games, args.workers, args.max_moves, args.seed,
+                        args.log)
+    print(f"{summary['engine_a']} vs {summary['engine_b']}: "
+          f"+{summary['wins']} ={summary['draws']} -{summary['losses']} over {summary['games']} games")
+    print(f"score {summary['score']:.3f}, Elo difference {summary['elo']:+.0f}")
+    for spec, ms in summary['ms_per_move'].items():
+        print(f"{spec}: {ms:.2f} ms per move")
+    print(f"{summary['seconds']:.2f} s total, {summary['games_per_second']:.2f} games per second")
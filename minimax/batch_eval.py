@@ -0,0 +1,87 @@
+import numpy as np
+from checkers.constants import ROWS, COLS, WHITE, SOLDIER, QUEEN, KING
+
+# Cell codes in the int8 encoding: positive for WHITE, negative for RED, 0 for empty
+CODES = {SOLDIER: 1, QUEEN: 2, KING: 3}
+KING_CODE = CODES[KING]
+
+# Same bonuses as get_optimized_evaluation_function in minimax/genetic_algorithm.py
+CENTER_COLS = [3, 4]
+ROW_BONUS = 0.1
+CENTER_BONUS = 0.2
+PROTECTED_BONUS = 0.1
+
+_ROWS = np.arange(ROWS, dtype=np.float64).reshape(1, ROWS, 1)
+_CENTER = np.zeros((1, ROWS, COLS), dtype=bool)
+_CENTER[:, :, CENTER_COLS] = True
+# is_protected only looks at neighbours inside rows/cols 0..7
+_GUARD_AREA = np.zeros((1, ROWS, COLS), dtype=bool)
+_GUARD_AREA[:, :8, :8] = True
+_DIAGONALS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def encode_board(board):
+    """Encode a Board as a (ROWS, COLS) int8 array of cell codes."""
+    cells = np.zeros((ROWS, COLS), dtype=np.int8)
+    for row in board.board:
+        for piece in row:
+            if piece != 0:
+                code = CODES[piece.type]
+                cells[piece.row, piece.col] = code if piece.color == WHITE else -code
+    return cells
+
+
+def encode_children(position, moves):
+    """Encode the positions reached by each move as one (len(moves), ROWS, COLS) batch.
+
+    The parent is encoded once and each child only patches the two cells
+    its move touches, so no child board is ever built.
+    """
+    batch = np.repeat(encode_board(position)[np.newaxis], len(moves), axis=0)
+    for i, move in enumerate(moves):
+        from_row, from_col, row, col = move[:4]
+        code = batch[i, from_row, from_col]
+        batch[i, from_row, from_col] = 0
+        if row == 0 or row == ROWS - 1:
+            code = KING_CODE if code > 0 else -KING_CODE
+        batch[i, row, col] = code
+    return batch
+
+
+def _protected(own):
+    # A piece is protected when a diagonal neighbour of the same color exists
+    guards = np.pad(own & _GUARD_AREA, ((0, 0), (1, 1), (1, 1)))
+    protected = np.zeros_like(own)
+    for dr, dc in _DIAGONALS:
+        protected |= guards[:, 1 + dr:1 + dr + ROWS, 1 + dc:1 + dc + COLS]
+    return protected & own
+
+
+def get_batch_evaluation_function(params):
+    """Vectorized version of get_optimized_evaluation_function(params).
+
+    The returned function takes an (N, ROWS, COLS) int8 batch and returns
+    an array of N scores (white minus red), computing the material,
+    row-advancement, center-control and protection terms for all
+    positions at once.
+    """
+    values = np.array([0.0, params['soldier'], params['queen'], params['king']])
+
+    def batch_evaluation(batch):
+        white = batch > 0
+        red = batch < 0
+        material = values[np.abs(batch)]
+        white_score = (material * white).sum(axis=(1, 2))
+        red_score = (material * red).sum(axis=(1, 2))
+
+        white_score += ((7 - _ROWS) * white).sum(axis=(1, 2)) * ROW_BONUS
+        red_score += (_ROWS * red).sum(axis=(1, 2)) * ROW_BONUS
+
+        white_score += (white & _CENTER).sum(axis=(1, 2)) * CENTER_BONUS
+        red_score += (red & _CENTER).sum(axis=(1, 2)) * CENTER_BONUS
+
+        white_score += _protected(white).sum(axis=(1, 2)) * PROTECTED_BONUS
+        red_score += _protected(red).sum(axis=(1, 2)) * PROTECTED_BONUS
+        return white_score - red_score
+
+    return batch_evaluation
@@ -0,0 +1,147 @@
+import argparse
+import json
+import platform
+import time
+from checkers.bitboard import BitBoard
+from checkers.board import Board
+from checkers.constants import RED, WHITE
+from minimax.algo import get_all_moves, minimax_search
+from minimax.algorithm import alpha_beta_search
+from minimax.engines import play_parallel_alpha_beta
+from minimax.ga_minimax import GA_minimax_search
+from minimax.genetic_algorithm import get_optimized_evaluation_function
+from minimax.ordering import MoveOrderer
+from minimax.stats import SearchStats
+from minimax.transposition import TranspositionTable
+
+# Bump when the report layout changes so stored results stay comparable
+FORMAT_VERSION = 3
+
+# Fixed positions as FEN (see Board.to_fen); the side to move is part of the string
+MIDGAME = 'K1K1K1K2/1Q3Q1Q1/S1S5S/3S1s3/1S5s1/s2s5/1s3s1s1/q1q3q2/1k1k1k1k1 w'
+ENDGAME = '9/4K4/9/2S6/9/6s2/9/3k5/9 w'
+
+
+def positions():
+    # name -> (board, side to move); RED moves first from the start position
+    midgame, endgame = Board.from_fen(MIDGAME), Board.from_fen(ENDGAME)
+    return {
+        'start': (Board(), RED),
+        'midgame': (midgame, midgame.turn),
+        'endgame': (endgame, endgame.turn),
+    }
+
+
+def perft(position, depth, color):
+    """Number of leaf positions exactly `depth` plies from position; finished games stop early."""
+    if depth == 0:
+        return 1
+    if position.winner() is not None:
+        return 0
+    next_color = RED if color == WHITE else WHITE
+    nodes = 0
+    for move in position.generate_moves(color):
+        undo = position.make_move(move)
+        nodes += perft(position, depth - 1, next_color) if depth > 1 else 1
+        position.unmake_move(undo)
+    return nodes
+
+
+def _timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_perft(depth):
+    results = []
+    for name, (board, color) in positions().items():
+        for representation, position in (('board', board), ('bitboard', BitBoard.from_board(board))):
+            nodes, seconds = _timed(perft, position, depth, color)
+            results.append({'position': name, 'board': representation, 'depth': depth, 'nodes': nodes,
+                            'seconds': seconds, 'nodes_per_second': nodes / seconds if seconds else 0.0})
+    return results
+
+
+def bench_engines(depth):
+    evaluation_function = get_optimized_evaluation_function({'soldier': 1, 'queen': 3, 'king': 5})
+    # Every engine searches to the same depth so the node counts are comparable
+    engines = {
+        'minimax': lambda board, d, white, stats: minimax_search(board, d, white, stats=stats),
+        'alpha_beta': lambda board, d, white, stats: alpha_beta_search(
+            board, d, float('-inf'), float('inf'), white, TranspositionTable(1 << 16), orderer=MoveOrderer(),
+            stats=stats),
+        # Goes through the engine so every position shares one process pool
+        'parallel_alpha_beta': lambda board, d, white, stats: play_parallel_alpha_beta(
+            board, WHITE if white else RED, d, stats),
+        'ga_minimax': lambda board, d, white, stats: GA_minimax_search(
+            board, d, float('-inf'), float('inf'), white, evaluation_function, stats=stats),
+    }
+    results = []
+    for name, (board, color) in positions().items():
+        for engine, search in engines.items():
+            # Timings include the small cost of keeping the statistics
+            stats = SearchStats()
+            _, seconds = _timed(search, board, depth, color == WHITE, stats)
+            results.append({'position': name, 'engine': engine, 'depth': depth, 'nodes': stats.nodes,
+                            'seconds': seconds, 'nodes_per_second': stats.nodes / seconds if seconds else 0.0,
+                            'stats': stats.to_dict()})
+    return results
+
+
+def bench_calls(repeat):
+    # Calls per second of the hot Board functions on the midgame position
+    board = Board.from_fen(MIDGAME)
+    pieces = board.get_all_pieces(WHITE)
+    evaluation_function = get_optimized_evaluation_function({'soldier': 1, 'queen': 3, 'king': 5})
+    calls = {
+        'get_valid_moves': lambda: [board.get_valid_moves(piece) for piece in pieces],
+        'get_all_moves': lambda: list(get_all_moves(board, WHITE)),
+        'evaluate': board.evaluate,
+        'count_material': board.count_material,
+        'optimized_evaluation': lambda: evaluation_function(board),
+    }
+    results = {}
+    for name, call in calls.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            call()
+        seconds = time.perf_counter() - start
+        results[name] = repeat / seconds if seconds else 0.0
+    return results
+
+
+def run(perft_depth=3, engine_depth=3, repeat=2000):
+    return {
+        'version': FORMAT_VERSION,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'perft': bench_perft(perft_depth),
+        'engines': bench_engines(engine_depth),
+        'calls_per_second': bench_calls(repeat),
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Perft counts, engine nodes per second and hot-call timings')
+    parser.add_argument('--perft-depth', type=int, default=3)
+    parser.add_argument('--engine-depth', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=2000)
+    parser.add_argument('--json', metavar='PATH', help="write the report as JSON ('-' for stdout)")
+    args = parser.parse_args()
+
+    report = run(args.perft_depth, args.engine_depth, args.repeat)
+    if args.json == '-':
+        print(json.dumps(report, indent=2))
+    else:
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump(report, f, indent=2)
+        for result in report['perft']:
+            print(f"perft {result['position']:8} {result['board']:8} depth {result['depth']}: "
+                  f"{result['nodes']:>9} nodes {result['nodes_per_second']:>10.0f}/s")
+        for result in report['engines']:
+            print(f"{result['engine']:19} {result['position']:8} depth {result['depth']}: "
+                  f"{result['nodes']:>9} nodes {result['nodes_per_second']:>10.0f}/s")
+        for name, rate in report['calls_per_second'].items():
+            print(f"{name:20} {rate:>10.0f} calls/s")
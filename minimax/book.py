@@ -0,0 +1,131 @@
+import argparse
+import mmap
+import os
+import struct
+import time
+from checkers.board import Board
+from checkers.constants import RED, WHITE, SOLDIER, QUEEN, KING
+from minimax.algorithm import alpha_beta_search
+from minimax.ordering import MoveOrderer
+from minimax.transposition import TranspositionTable
+
+# File layout: a 12-byte header, then fixed-size records sorted by key so
+# lookups are a binary search straight over the memory-mapped file
+MAGIC = b'CKBK'
+BOOK_VERSION = 1
+HEADER = struct.Struct('<4sHHI')        # magic, version, record size, record count
+RECORD = struct.Struct('<QBBBBB')       # key, from_row, from_col, to_row, to_col, captured code
+BOOK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'opening_book.bin')
+
+# Captured piece type <-> byte stored in a record
+CAPTURE_CODES = {None: 0, SOLDIER: 1, QUEEN: 2, KING: 3}
+CAPTURE_TYPES = {code: piece_type for piece_type, code in CAPTURE_CODES.items()}
+
+
+class OpeningBook:
+    """Read-only view of a book file; the file is mapped on first probe, never parsed."""
+
+    def __init__(self, path=BOOK_FILE):
+        self.path = path
+        self.data = None
+        self.count = 0
+
+    def _open(self):
+        # A missing, empty or foreign file just leaves the book empty
+        self.data = b''
+        try:
+            with open(self.path, 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+        if len(data) < HEADER.size:
+            return
+        magic, version, record_size, count = HEADER.unpack_from(data)
+        if (magic, version, record_size) != (MAGIC, BOOK_VERSION, RECORD.size) or \
+                len(data) < HEADER.size + count * RECORD.size:
+            return
+        self.data, self.count = data, count
+
+    def lookup(self, key):
+        """Stored move for a TranspositionTable.key, or None."""
+        if self.data is None:
+            self._open()
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            record = RECORD.unpack_from(self.data, HEADER.size + middle * RECORD.size)
+            if record[0] < key:
+                low = middle + 1
+            elif record[0] > key:
+                high = middle
+            else:
+                from_row, from_col, to_row, to_col, captured = record[1:]
+                return from_row, from_col, to_row, to_col, CAPTURE_TYPES[captured]
+        return None
+
+    def probe(self, position, color):
+        """Book move for color in position, or None when out of book."""
+        move = self.lookup(TranspositionTable.key(position, color == WHITE))
+        # Keys are hashes, so check the move really belongs to this position
+        if move is not None and position.is_legal(move, color):
+            return move
+        return None
+
+
+def build_book(plies=4, depth=6, expand=RED, progress=None):
+    """Search every position within `plies` plies of the start position.
+
+    All moves of the `expand` side are followed, the other side only
+    follows its own book move, so the book covers every line a human
+    playing `expand` can choose. Returns {key: move}.
+    """
+    tt = TranspositionTable()
+    orderer = MoveOrderer()
+    entries = {}
+
+    def visit(position, color, ply):
+        key = TranspositionTable.key(position, color == WHITE)
+        if ply >= plies or key in entries or position.winner() is not None:
+            return
+        tt.new_search()
+        orderer.new_search()
+        _, move = alpha_beta_search(position, depth, float('-inf'), float('inf'), color == WHITE, tt,
+                                    orderer=orderer)
+        if move is None:
+            return
+        entries[key] = move
+        if progress:
+            progress(len(entries))
+        next_color = RED if color == WHITE else WHITE
+        for reply in (position.legal_moves(color) if color == expand else [move]):
+            undo = position.make_move(reply)
+            visit(position, next_color, ply + 1)
+            position.unmake_move(undo)
+
+    # RED moves first, as in the game
+    visit(Board(), RED, 0)
+    return entries
+
+
+def write_book(entries, path=BOOK_FILE):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, BOOK_VERSION, RECORD.size, len(entries)))
+        for key in sorted(entries):
+            from_row, from_col, to_row, to_col, captured = entries[key]
+            f.write(RECORD.pack(key, from_row, from_col, to_row, to_col, CAPTURE_CODES[captured]))
+    os.replace(tmp_path, path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the opening book from deep searches of the first plies')
+    parser.add_argument('--plies', type=int, default=4)
+    parser.add_argument('--depth', type=int, default=6)
+    parser.add_argument('--output', default=BOOK_FILE)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    entries = build_book(args.plies, args.depth,
+                         progress=lambda count: print(f"\r{count} positions", end='', flush=True))
+    write_book(entries, args.output)
+    print(f"\nwrote {len(entries)} positions to {args.output} in {time.perf_counter() - start:.1f} s")
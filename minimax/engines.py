@@ -0,0 +1,116 @@
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from checkers.constants import RED, WHITE
+from minimax.algo import minimax_search
+from minimax.algorithm import alpha_beta_search, iterative_deepening_search
+from minimax.book import OpeningBook
+from minimax.ga_minimax import GA_minimax_search
+from minimax.genetic_algorithm import get_optimized_evaluation_function
+from minimax.ordering import MoveOrderer
+from minimax.parallel import parallel_alpha_beta_search
+from minimax.tablebase import Tablebase
+from minimax.transposition import TranspositionTable
+from minimax.fuzzy import best_fuzzy_move
+
+# Same weights as Board.evaluate, used until tuned GA parameters are supplied
+DEFAULT_PARAMS = {'soldier': 1, 'queen': 3, 'king': 5}
+
+OPENING_BOOK = OpeningBook()
+TABLEBASE = Tablebase()
+# Pool for parallel_alpha_beta, started on its first move and reused for the rest
+PARALLEL_WORKERS = os.cpu_count() or 1
+_parallel_executor = None
+
+
+def play_minimax(board, color, depth=2, stats=None):
+    if stats is not None:
+        stats.begin_depth()
+    move = minimax_search(board, depth, color == WHITE, stats=stats)[1]
+    if stats is not None:
+        stats.end_depth(depth)
+    return move
+
+
+def play_alpha_beta(board, color, depth=3, stats=None):
+    if stats is not None:
+        stats.begin_depth()
+    move = alpha_beta_search(board, depth, float('-inf'), float('inf'), color == WHITE,
+                             TranspositionTable(1 << 16), orderer=MoveOrderer(), tablebase=TABLEBASE, stats=stats)[1]
+    if stats is not None:
+        stats.end_depth(depth)
+    return move
+
+
+def play_iterative(board, color, milliseconds=500, stats=None):
+    book_move = OPENING_BOOK.probe(board, color)
+    if book_move is not None:
+        return book_move
+    return iterative_deepening_search(board, milliseconds / 1000, color == WHITE, tt=TranspositionTable(1 << 16),
+                                      tablebase=TABLEBASE, stats=stats)[1]
+
+
+def play_parallel_alpha_beta(board, color, depth=3, stats=None):
+    global _parallel_executor
+    # In a pool worker (arena games, GA fitness) the cores are already in use, and a pool of its
+    # own would keep the worker from exiting when its pool shuts down, so search serially there
+    workers = PARALLEL_WORKERS if multiprocessing.parent_process() is None else 1
+    if _parallel_executor is None and workers > 1:
+        _parallel_executor = ProcessPoolExecutor(max_workers=workers)
+        atexit.register(_parallel_executor.shutdown)
+    if stats is not None:
+        stats.begin_depth()
+    move = parallel_alpha_beta_search(board, depth, color == WHITE, workers, _parallel_executor,
+                                      stats=stats)[1]
+    if stats is not None:
+        stats.end_depth(depth)
+    return move
+
+
+def play_ga_minimax(board, color, depth=4, params=None, stats=None):
+    evaluation_function = get_optimized_evaluation_function(params or DEFAULT_PARAMS)
+    if stats is not None:
+        stats.begin_depth()
+    move = GA_minimax_search(board, depth, float('-inf'), float('inf'), color == WHITE, evaluation_function,
+                             stats=stats)[1]
+    if stats is not None:
+        stats.end_depth(depth)
+    return move
+
+
+def play_fuzzy(board, color, depth=None, stats=None):
+    return best_fuzzy_move(board, color)
+
+
+# name -> function(board, color, setting, stats=None) returning a move tuple or None.
+# The optional setting is the search depth (milliseconds for 'iterative');
+# stats is an optional minimax.stats.SearchStats the search fills in.
+ENGINES = {
+    'minimax': play_minimax,
+    'alpha_beta': play_alpha_beta,
+    'parallel_alpha_beta': play_parallel_alpha_beta,
+    'iterative': play_iterative,
+    'ga_minimax': play_ga_minimax,
+    'fuzzy': play_fuzzy,
+}
+
+
+def get_engine(spec):
+    """Turn 'name' or 'name:setting' (e.g. 'alpha_beta:4') into a function(board, color, stats=None).
+
+    A function(board, color) is returned unchanged.
+    """
+    if callable(spec):
+        return spec
+    name, _, setting = spec.partition(':')
+    if name not in ENGINES:
+        raise ValueError(f"unknown engine {name!r}, choose from {', '.join(ENGINES)}")
+    engine = ENGINES[name]
+    if not setting:
+        return engine
+    return lambda board, color, stats=None: engine(board, color, int(setting), stats=stats)
+
+
+def opponent(color):
+    return RED if color == WHITE else WHITE
@@ -1,17 +1,13 @@
+import hashlib
+import os
 import numpy as np
 import skfuzzy as fuzz
 from skfuzzy import control as ctrl
 from checkers.board import Board  # Assuming Board class from your game implementation
+from checkers.constants import WHITE, SOLDIER, QUEEN, KING
 from minimax.algorithm import alpha_beta_minimax  # Import alpha_beta_minimax
-from copy import deepcopy
 import random
 
-# Constants for colors
-RED = (255, 0, 0)
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-BLUE = (0, 0, 255)
-GREY = (128, 128, 128)
 ROWS, COLS = 9, 9  # Example board size, adjust as per your game
 
 # Fuzzy variables
@@ -71,31 +67,93 @@ rules = [
 move_ctrl = ctrl.ControlSystem(rules)
 move_simulation = ctrl.ControlSystemSimulation(move_ctrl)
 
+# move_strength is precomputed on this grid of (piece_value, game_phase) inputs and interpolated
+TABLE_STEP = 0.5
+TABLE_SIZE = int(10 / TABLE_STEP) + 1
+TABLE_DIR = os.path.dirname(os.path.abspath(__file__))
+_move_strength_table = None
+
+
+def rule_set_key():
+    """Short digest of the membership functions, rules and grid; names the cached table."""
+    parts = []
+    for variable in (piece_value, game_phase, move_strength):
+        for term_name, term in variable.terms.items():
+            parts.append(f"{variable.label}[{term_name}] {term.mf.tolist()}")
+    parts.extend(str(rule) for rule in rules)
+    parts.append(f"step {TABLE_STEP}")
+    return hashlib.sha1('\n'.join(parts).encode()).hexdigest()[:16]
+
+
+def build_move_strength_table():
+    table = np.zeros((TABLE_SIZE, TABLE_SIZE))
+    for i in range(TABLE_SIZE):
+        for j in range(TABLE_SIZE):
+            move_simulation.input['piece_value'] = i * TABLE_STEP
+            move_simulation.input['game_phase'] = j * TABLE_STEP
+            try:
+                move_simulation.compute()
+                table[i, j] = move_simulation.output['move_strength']
+            except (ValueError, KeyError):
+                # No rule fires at this input; same fallback of 0 as a failed compute
+                table[i, j] = 0
+    return table
+
+
+def load_move_strength_table():
+    # Built once per rule set and cached next to this module
+    path = os.path.join(TABLE_DIR, f"fuzzy_table_{rule_set_key()}.npy")
+    try:
+        table = np.load(path)
+        if table.shape == (TABLE_SIZE, TABLE_SIZE):
+            return table
+    except (OSError, ValueError):
+        pass
+    table = build_move_strength_table()
+    try:
+        np.save(path, table)
+    except OSError:
+        pass
+    return table
+
+
+def fuzzy_move_strength(piece_value_value, game_phase_value):
+    """Defuzzified move_strength, bilinearly interpolated from the precomputed table."""
+    global _move_strength_table
+    if _move_strength_table is None:
+        _move_strength_table = load_move_strength_table().tolist()
+    table = _move_strength_table
+
+    x = min(max(piece_value_value, 0), 10) / TABLE_STEP
+    y = min(max(game_phase_value, 0), 10) / TABLE_STEP
+    i = min(int(x), TABLE_SIZE - 2)
+    j = min(int(y), TABLE_SIZE - 2)
+    fx, fy = x - i, y - j
+    return ((table[i][j] * (1 - fy) + table[i][j + 1] * fy) * (1 - fx) +
+            (table[i + 1][j] * (1 - fy) + table[i + 1][j + 1] * fy) * fx)
+
+
+def game_phase_of(board):
+    # The board keeps its piece counts up to date, so there is no need to scan it
+    return ((board.red_left + board.white_left) / (ROWS * COLS)) * 10
+
 # Function to calculate fuzzy move strength
-def calculate_fuzzy_move(board, row, col):
+def calculate_fuzzy_move(board, row, col, game_phase_value=None, color=WHITE):
     piece = board.get_piece(row, col)
-    if piece and piece.color == WHITE:  # Assuming AI controls WHITE pieces
-        if piece.type == 'soldier':
+    if piece and piece.color == color:  # The AI plays WHITE unless told otherwise
+        if piece.type == SOLDIER:
             piece_value_value = 2
-        elif piece.type == 'queen':
+        elif piece.type == QUEEN:
             piece_value_value = 5
-        elif piece.type == 'king':
+        elif piece.type == KING:
             piece_value_value = 8
         else:
             piece_value_value = 1
         
-        total_pieces = sum(1 for r in range(ROWS) for c in range(COLS) if board.get_piece(r, c))
-        game_phase_value = (total_pieces / (ROWS * COLS)) * 10
-        
-        move_simulation.input['piece_value'] = piece_value_value
-        move_simulation.input['game_phase'] = game_phase_value
+        if game_phase_value is None:
+            game_phase_value = game_phase_of(board)
         
-        try:
-            move_simulation.compute()
-            move_strength = move_simulation.output['move_strength']
-        except ValueError as e:
-            print(f"Error in fuzzy computation: {e}")
-            move_strength = 0
+        move_strength = fuzzy_move_strength(piece_value_value, game_phase_value)
         
         # Get all possible moves for the piece
         moves = board.get_valid_moves(piece)
@@ -112,45 +170,35 @@ def calculate_fuzzy_move(board, row, col):
     
     return {}
 
-def simulate_move(piece, move, board, skip):
-    # Ensure piece is a valid piece object
-    if piece:
-        if skip:
-            for skipped_piece in skip:
-                board.remove([skipped_piece])
-        board.move(piece, move[0], move[1])
-    return board
-
-def determine_best_fuzzy_move(board):
+def best_fuzzy_move(board, color=WHITE):
+    # Returns the chosen (from_row, from_col, to_row, to_col, captured type) move, or None
     best_moves = []
     best_strength = -1
+    game_phase_value = game_phase_of(board)
 
     for row in range(ROWS):
         for col in range(COLS):
             piece = board.get_piece(row, col)
-            if piece and piece.color == WHITE:  # Assuming AI controls WHITE pieces
-                move_strengths = calculate_fuzzy_move(board, row, col)
+            if piece and piece.color == color:
+                move_strengths = calculate_fuzzy_move(board, row, col, game_phase_value, color)
                 for move, strength in move_strengths.items():
                     if strength > best_strength:
                         best_strength = strength
-                        best_moves = [(row, col, move, move_strengths)]
+                        best_moves = [(row, col, move)]
                     elif strength == best_strength:
-                        best_moves.append((row, col, move, move_strengths))
+                        best_moves.append((row, col, move))
 
     if best_moves:
-        best_move = random.choice(best_moves)
-        row, col, move, move_strengths = best_move
-
-        # Make a deepcopy of the board to simulate the move
-        new_board = deepcopy(board)
-        piece = new_board.get_piece(row, col)
-        valid_moves = new_board.get_valid_moves(piece)
-        skip = valid_moves[move] if move in valid_moves else []
-        new_board = simulate_move(piece, move, new_board, skip)
-        return new_board
+        row, col, (to_row, to_col) = random.choice(best_moves)
+        target = board.get_piece(to_row, to_col)
+        return row, col, to_row, to_col, target.type if target != 0 else None
 
     return None
 
+def determine_best_fuzzy_move(board):
+    move = best_fuzzy_move(board, WHITE)
+    return board.child(move) if move is not None else None
+
 # Example usage
 if __name__ == '__main__':
     board = Board()  # Instantiate your Board class with initial setup
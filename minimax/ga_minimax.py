@@ -1,23 +1,49 @@
-from copy import deepcopy
-RED = (255, 0, 0)
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-BLUE = (0, 0, 255)
-GREY = (128, 128, 128)
-
 import random
-from copy import deepcopy
+import time
 from checkers.constants import RED, WHITE
+from minimax.algorithm import SearchAborted
+from minimax.batch_eval import encode_children
 
-def GA_minimax(position, depth, alpha, beta, max_player, game, evaluation_function):
+def GA_minimax(position, depth, alpha, beta, max_player, game, evaluation_function, stop=None, stats=None):
     if depth == 0 or position.winner() is not None:
         return evaluation_function(position) + random.uniform(-0.5, 0.5), position  # Add small randomness to evaluation
-    
+
+    if stats is not None:
+        stats.begin_depth()
+    evaluation, move = GA_minimax_search(position, depth, alpha, beta, max_player, evaluation_function, stop, stats)
+    if stats is not None:
+        stats.end_depth(depth)
+    return evaluation, position.child(move) if move is not None else None
+
+def GA_minimax_search(position, depth, alpha, beta, max_player, evaluation_function, stop=None, stats=None, ply=0):
+    if stop is not None and stop.is_set():
+        raise SearchAborted
+    if stats is not None:
+        stats.node(ply)
+    if depth == 0 or position.winner() is not None:
+        if stats is not None:
+            return stats.evaluate(position, evaluation_function) + random.uniform(-0.5, 0.5), None
+        return evaluation_function(position) + random.uniform(-0.5, 0.5), None  # Add small randomness to evaluation
+
+    # Evaluators with a vectorized twin (see get_optimized_evaluation_function) score the last ply in one call
+    batch_evaluation = getattr(evaluation_function, 'batch', None)
+    if depth == 1 and batch_evaluation is not None:
+        return evaluate_leaves(position, max_player, batch_evaluation, stats, ply)
+
+    moves = get_all_moves(position, WHITE if max_player else RED)
+    if stats is not None:
+        moves = stats.timed_moves(moves)
+
     if max_player:
         max_eval = float('-inf')
         best_moves = []
-        for move in get_all_moves(position, WHITE, game):
-            evaluation, _ = GA_minimax(move, depth-1, alpha, beta, False, game, evaluation_function)
+        for move in moves:
+            undo = position.make_move(move)
+            try:
+                evaluation, _ = GA_minimax_search(position, depth-1, alpha, beta, False, evaluation_function, stop,
+                                                  stats, ply + 1)
+            finally:
+                position.unmake_move(undo)
             if evaluation > max_eval:
                 max_eval = evaluation
                 best_moves = [move]
@@ -25,13 +51,20 @@ def GA_minimax(position, depth, alpha, beta, max_player, game, evaluation_functi
                 best_moves.append(move)
             alpha = max(alpha, max_eval)
             if beta <= alpha:
+                if stats is not None:
+                    stats.cutoff(ply)
                 break
-        return max_eval, random.choice(best_moves) 
+        return max_eval, random.choice(best_moves) if best_moves else None
     else:
         min_eval = float('inf')
         best_moves = []
-        for move in get_all_moves(position, RED, game):
-            evaluation, _ = GA_minimax(move, depth-1, alpha, beta, True, game, evaluation_function)
+        for move in moves:
+            undo = position.make_move(move)
+            try:
+                evaluation, _ = GA_minimax_search(position, depth-1, alpha, beta, True, evaluation_function, stop,
+                                                  stats, ply + 1)
+            finally:
+                position.unmake_move(undo)
             if evaluation < min_eval:
                 min_eval = evaluation
                 best_moves = [move]
@@ -39,32 +72,41 @@ def GA_minimax(position, depth, alpha, beta, max_player, game, evaluation_functi
                 best_moves.append(move)
             beta = min(beta, min_eval)
             if beta <= alpha:
+                if stats is not None:
+                    stats.cutoff(ply)
                 break
-        return min_eval, random.choice(best_moves) 
-
+        return min_eval, random.choice(best_moves) if best_moves else None
 
-def simulate_move(piece, move, board, game, skip):
-    # Ensure piece is a valid piece object
-    if piece:
-        if skip:
-            for skipped_piece in skip:
-                board.remove([skipped_piece])
-        board.move(piece, move[0], move[1])
-    return board
 
+def evaluate_leaves(position, max_player, batch_evaluation, stats=None, ply=0):
+    moves = get_all_moves(position, WHITE if max_player else RED)
+    moves = list(moves if stats is None else stats.timed_moves(moves))
+    if not moves:
+        return float('-inf') if max_player else float('inf'), None
+    if stats is not None:
+        start = time.perf_counter()
+    scores = batch_evaluation(encode_children(position, moves))
+    if stats is not None:
+        stats.evaluated_batch(ply + 1, len(moves), time.perf_counter() - start)
 
-def get_all_moves(board, color, game):
-    moves = []
-    for piece in board.get_all_pieces(color):
-        valid_moves = board.get_valid_moves(piece)
-        for move, skip in valid_moves.items():
-            # Create a deepcopy of the board to simulate the move
-            temp_board = deepcopy(board)
-            temp_piece = temp_board.get_piece(piece.row, piece.col)
-            new_board = simulate_move(temp_piece, move, temp_board, game, skip)
-            moves.append(new_board)
-            random.shuffle(moves) 
-            #print(f"Generated move: {move} for piece at {piece.row}, {piece.col}")
-    return moves
+    best_eval = None
+    best_moves = []
+    for move, score in zip(moves, scores):
+        evaluation = float(score) + random.uniform(-0.5, 0.5)  # Same randomness as a single leaf
+        if best_eval is None or (evaluation > best_eval if max_player else evaluation < best_eval):
+            best_eval = evaluation
+            best_moves = [move]
+        elif evaluation == best_eval:
+            best_moves.append(move)
+    return best_eval, random.choice(best_moves)
 
 
+def get_all_moves(board, color):
+    # Lazily yields moves in random order, one piece at a time, so a cutoff
+    # skips generating the moves of the remaining pieces
+    pieces = board.get_all_pieces(color)
+    random.shuffle(pieces)
+    for piece in pieces:
+        moves = list(board.piece_moves(piece))
+        random.shuffle(moves)
+        yield from moves
@@ -1,29 +1,118 @@
+import argparse
+import json
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
-from checkers.constants import RED, WHITE
-from checkers.game import Game
+from functools import partial
+from checkers.constants import RED, WHITE, SOLDIER, QUEEN
+from minimax.batch_eval import get_batch_evaluation_function
 #from minimax.algorithm import GA_minimax, get_all_moves, simulate_move
 
 # Define a default evaluation function
 def default_evaluation(board):
     return board.evaluate()
 
+# Fitness is the score of a genome over short games against a fixed baseline engine
+FITNESS_BASELINE = 'alpha_beta:2'
+FITNESS_GAMES = 2
+FITNESS_DEPTH = 2
+FITNESS_MAX_MOVES = 100
+# Material lead that counts as a full win when a game reaches FITNESS_MAX_MOVES
+ADJUDICATION_MARGIN = 10
+
+# Tuned parameters and training checkpoints are JSON files tagged with this version
+PARAMS_VERSION = 1
+PARAMS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ga_params.json')
+
 # Genetic Algorithm to optimize evaluation function
-def genetic_algorithm(population_size=20, generations=100, mutation_rate=0.1):
-    population = [generate_random_params() for _ in range(population_size)]
-    for _ in range(generations):
-        fitness_scores = [evaluate_fitness(params) for params in population]
-        selected_population = [select(population, fitness_scores) for _ in range(population_size // 2)]
-        offspring = []
-        for i in range(0, len(selected_population), 2):
-            parent1 = selected_population[i]
-            parent2 = selected_population[i + 1] if i + 1 < len(selected_population) else selected_population[0]
-            offspring.extend(crossover(parent1, parent2))
-        population = selected_population + offspring
-        population = [mutate(params, mutation_rate) for params in population]
-    best_params = max(population, key=lambda params: evaluate_fitness(params))
+def genetic_algorithm(population_size=20, generations=100, mutation_rate=0.1, workers=None, checkpoint=None):
+    """Evolve evaluation parameters and return the best genome.
+
+    With a checkpoint path the population, generation number, RNG state and
+    fitness scores are saved after every generation, and a run started with
+    an existing checkpoint resumes where it stopped.
+    """
+    state = load_checkpoint(checkpoint) if checkpoint else None
+    if state:
+        population, start, fitness_cache = state
+    else:
+        population = [generate_random_params() for _ in range(population_size)]
+        start, fitness_cache = 0, {}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        for generation in range(start, generations):
+            fitness_scores = evaluate_population(population, fitness_cache, executor)
+            selected_population = [select(population, fitness_scores) for _ in range(len(population) // 2)]
+            offspring = []
+            for i in range(0, len(selected_population), 2):
+                parent1 = selected_population[i]
+                parent2 = selected_population[i + 1] if i + 1 < len(selected_population) else selected_population[0]
+                offspring.extend(crossover(parent1, parent2))
+            population = selected_population + offspring
+            population = [mutate(params, mutation_rate) for params in population]
+            if checkpoint:
+                save_checkpoint(checkpoint, population, generation + 1, fitness_cache)
+        fitness_scores = evaluate_population(population, fitness_cache, executor)
+    best_params = max(zip(population, fitness_scores), key=lambda scored: scored[1])[0]
     return best_params
 
+def genome_key(params):
+    return (params['soldier'], params['queen'], params['king'])
+
+def evaluate_population(population, fitness_cache, executor):
+    # Self-play games are deterministic, so each distinct genome is only ever played once
+    pending = {}
+    for params in population:
+        key = genome_key(params)
+        if key not in fitness_cache and key not in pending:
+            pending[key] = dict(params)
+    for key, fitness in zip(pending, executor.map(evaluate_fitness, pending.values())):
+        fitness_cache[key] = fitness
+    return [fitness_cache[genome_key(params)] for params in population]
+
+def _write_json(path, data):
+    # Write beside the target and rename, so an interrupted save never leaves a torn file
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if data.get('version') == PARAMS_VERSION else None
+
+def save_params(params, path=PARAMS_FILE, fitness=None):
+    _write_json(path, {'version': PARAMS_VERSION, 'params': dict(params), 'fitness': fitness})
+
+def load_params(path=PARAMS_FILE):
+    # Tuned parameters, or None when there is no usable file
+    data = _read_json(path)
+    return data['params'] if data else None
+
+def save_checkpoint(path, population, generation, fitness_cache):
+    version, internal_state, gauss_next = random.getstate()
+    _write_json(path, {
+        'version': PARAMS_VERSION,
+        'generation': generation,
+        'population': population,
+        'fitness': [[list(key), score] for key, score in fitness_cache.items()],
+        'random_state': [version, list(internal_state), gauss_next],
+    })
+
+def load_checkpoint(path):
+    # Restores the RNG and returns (population, generation, fitness_cache), or None
+    data = _read_json(path)
+    if not data:
+        return None
+    version, internal_state, gauss_next = data['random_state']
+    random.setstate((version, tuple(internal_state), gauss_next))
+    fitness_cache = {tuple(key): score for key, score in data['fitness']}
+    return data['population'], data['generation'], fitness_cache
+
 def generate_random_params():
     return {
         'soldier': random.uniform(0, 1),
@@ -31,19 +120,40 @@ def generate_random_params():
         'king': random.uniform(3, 5)
     }
 
-def evaluate_fitness(params):
-    # For simplicity, we'll just return a random fitness score here
-    return random.uniform(0, 1)
+def evaluate_fitness(params, games=FITNESS_GAMES, depth=FITNESS_DEPTH, max_moves=FITNESS_MAX_MOVES):
+    """Score in [0, 1] of GA_minimax with params against FITNESS_BASELINE.
+
+    Colors alternate between games. A game still running after max_moves
+    plies is scored from the material balance instead of as a plain draw,
+    so short games still separate good genomes from bad ones.
+    """
+    # Imported here: the engines module itself imports this one
+    from minimax.arena import play_game
+    from minimax.engines import play_ga_minimax
+
+    tuned = partial(play_ga_minimax, depth=depth, params=params)
+    score = 0
+    for game in range(games):
+        tuned_white = game % 2 == 0
+        white, red = (tuned, FITNESS_BASELINE) if tuned_white else (FITNESS_BASELINE, tuned)
+        result = play_game(white, red, max_moves, seed=game)
+        if result['winner'] is not None:
+            score += 1 if result['winner'] == ('white' if tuned_white else 'red') else 0
+        else:
+            lead = result['material'] if tuned_white else -result['material']
+            score += 0.5 + max(-0.5, min(0.5, lead / (2 * ADJUDICATION_MARGIN)))
+    return score / games
 
 def select(population, fitness_scores):
+    # Returns a copy: a genome picked twice must not share one dict that mutate then changes twice
     total_score = sum(fitness_scores)
     pick = random.uniform(0, total_score)
     current = 0
     for params, score in zip(population, fitness_scores):
         current += score
         if current > pick:
-            return params
-    return population[-1]
+            return dict(params)
+    return dict(population[-1])
 
 def mutate(params, mutation_rate):
     if random.random() < mutation_rate:
@@ -82,7 +192,7 @@ def get_optimized_evaluation_function(params):
                 if piece != 0:
                     # Base score for the piece type
                     if piece.color == WHITE:
-                        piece_score = params['soldier'] if piece.type == 'soldier' else params['queen'] if piece.type == 'queen' else params['king']
+                        piece_score = params['soldier'] if piece.type == SOLDIER else params['queen'] if piece.type == QUEEN else params['king']
                         white_score += piece_score
 
                         # Positioning bonus
@@ -96,7 +206,7 @@ def get_optimized_evaluation_function(params):
                         if is_protected(board, piece):
                             white_score += 0.1
                     elif piece.color == RED:
-                        piece_score = params['soldier'] if piece.type == 'soldier' else params['queen'] if piece.type == 'queen' else params['king']
+                        piece_score = params['soldier'] if piece.type == SOLDIER else params['queen'] if piece.type == QUEEN else params['king']
                         red_score += piece_score
 
                         # Positioning bonus
@@ -112,6 +222,8 @@ def get_optimized_evaluation_function(params):
 
         return white_score - red_score
 
+    # Vectorized twin used by GA_minimax to score a whole last ply at once
+    optimized_evaluation.batch = get_batch_evaluation_function(params)
     return optimized_evaluation
 
 def is_protected(board, piece):
@@ -126,3 +238,18 @@ def is_protected(board, piece):
                 return True
     return False
 
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Tune the evaluation parameters and save them for the game')
+    parser.add_argument('--population', type=int, default=20)
+    parser.add_argument('--generations', type=int, default=100)
+    parser.add_argument('--mutation-rate', type=float, default=0.1)
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
+    parser.add_argument('--checkpoint', help='save progress here after every generation and resume from it')
+    parser.add_argument('--output', default=PARAMS_FILE)
+    args = parser.parse_args()
+
+    best = genetic_algorithm(args.population, args.generations, args.mutation_rate, args.workers, args.checkpoint)
+    save_params(best, args.output, evaluate_fitness(best))
+    print(f"saved {best} to {args.output}")
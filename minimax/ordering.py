@@ -0,0 +1,62 @@
+from checkers.constants import PIECE_VALUES
+
+
+class MoveOrderer:
+    """Move ordering state for alpha-beta: killer moves per ply and a history table.
+
+    Also counts beta cutoffs and how many of them came from the first move
+    searched, which is the usual measure of ordering quality.
+    """
+
+    def __init__(self, max_ply=64):
+        self.killers = [[None, None] for _ in range(max_ply)]
+        self.history = {}
+        self.cutoffs = self.first_move_cutoffs = 0
+
+    def ordered_moves(self, position, color, ply, tt_move=None):
+        """Yield moves in stages: hash move, captures, killers, quiet moves.
+
+        Each stage is only generated once the previous one is exhausted, so
+        a cutoff on an early move never pays for generating the quiet moves.
+        """
+        if tt_move is not None and position.is_legal(tt_move, color):
+            yield tt_move
+
+        # Most valuable victim first
+        captures = sorted(position.generate_moves(color, True), key=lambda move: PIECE_VALUES[move[4]],
+                          reverse=True)
+        for move in captures:
+            if move != tt_move:
+                yield move
+
+        killers = tuple(self.killers[ply]) if ply < len(self.killers) else (None, None)
+        for killer in killers:
+            if killer is not None and killer != tt_move and position.is_legal(killer, color):
+                yield killer
+
+        history = self.history
+        quiet = [move for move in position.generate_moves(color, False) if move != tt_move and move not in killers]
+        quiet.sort(key=lambda move: history.get(move, 0), reverse=True)
+        yield from quiet
+
+    def cutoff(self, move, ply, depth, index):
+        # Record a beta cutoff caused by the index-th move searched at this ply
+        self.cutoffs += 1
+        if index == 0:
+            self.first_move_cutoffs += 1
+        if move[4] is None:
+            if ply < len(self.killers):
+                killers = self.killers[ply]
+                if killers[0] != move:
+                    killers[1] = killers[0]
+                    killers[0] = move
+            self.history[move] = self.history.get(move, 0) + depth * depth
+
+    def new_search(self):
+        # Killers are position specific; history is kept but aged
+        for killers in self.killers:
+            killers[0] = killers[1] = None
+        self.history = {move: score // 2 for move, score in self.history.items() if score > 1}
+
+    def first_move_cutoff_rate(self):
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
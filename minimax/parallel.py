@@ -0,0 +1,125 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from checkers.board import Board
+from checkers.constants import RED, WHITE
+from minimax.algorithm import alpha_beta_search
+from minimax.ordering import MoveOrderer
+from minimax.stats import SearchStats
+from minimax.transposition import TranspositionTable
+
+
+def parallel_alpha_beta(position, depth, max_player=True, workers=None, executor=None, stats=None):
+    """Root-split alpha-beta over a process pool.
+
+    The first (best ordered) root move is searched here to get a bound;
+    the remaining root moves are then searched in parallel against that
+    bound, one task per move. Pass an executor to reuse a pool across
+    moves, otherwise a pool of `workers` processes (default: all cores) is
+    started for this call. With a single worker there is nothing to split,
+    so the whole tree is searched here instead. Returns (evaluation,
+    new_board) like alpha_beta_minimax.
+    """
+    if depth == 0 or position.winner() is not None:
+        return position.evaluate(), position
+
+    evaluation, move = parallel_alpha_beta_search(position, depth, max_player, workers, executor, stats)
+    return evaluation, position.child(move) if move is not None else None
+
+
+def parallel_alpha_beta_search(position, depth, max_player=True, workers=None, executor=None, stats=None):
+    # Same as parallel_alpha_beta but returns (evaluation, move) and leaves the board alone
+    if workers == 1 or (executor is None and not workers and os.cpu_count() == 1):
+        return alpha_beta_search(position, depth, float('-inf'), float('inf'), max_player,
+                                 TranspositionTable(1 << 16), orderer=MoveOrderer(), stats=stats)
+
+    if stats is not None:
+        stats.node(0)
+    color = WHITE if max_player else RED
+    moves = list(MoveOrderer().ordered_moves(position, color, 0))
+    if not moves:
+        return float('-inf') if max_player else float('inf'), None
+
+    best_move = moves[0]
+    best_eval, first_stats = _search_root_move(position, best_move, depth, max_player, float('-inf'), float('inf'),
+                                               stats is not None)
+    if stats is not None:
+        stats.merge(first_stats)
+    if len(moves) > 1:
+        alpha, beta = (best_eval, float('inf')) if max_player else (float('-inf'), best_eval)
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+        try:
+            # Workers get the 31-byte packed position rather than a pickled Board
+            data = position.to_bytes(color)
+            futures = [executor.submit(_search_packed_root_move, data, move, depth, max_player, alpha, beta,
+                                       stats is not None)
+                       for move in moves[1:]]
+            # Moves that fail low only prove they are no better, which is all we need
+            for move, future in zip(moves[1:], futures):
+                evaluation, move_stats = future.result()
+                if stats is not None:
+                    stats.merge(move_stats)
+                if (evaluation > best_eval) if max_player else (evaluation < best_eval):
+                    best_eval, best_move = evaluation, move
+        finally:
+            if own_executor:
+                executor.shutdown()
+    return best_eval, best_move
+
+
+def _search_packed_root_move(data, move, depth, max_player, alpha, beta, keep_stats=False):
+    # Runs in a worker process
+    return _search_root_move(Board.from_bytes(data), move, depth, max_player, alpha, beta, keep_stats)
+
+
+def _search_root_move(position, move, depth, max_player, alpha, beta, keep_stats=False):
+    # Returns (evaluation, SearchStats or None); the stats travel back from a worker with the result
+    stats = SearchStats() if keep_stats else None
+    undo = position.make_move(move)
+    try:
+        evaluation, _ = alpha_beta_search(position, depth - 1, alpha, beta, not max_player,
+                                          TranspositionTable(1 << 16), ply=1, orderer=MoveOrderer(), stats=stats)
+    finally:
+        position.unmake_move(undo)
+    return evaluation, stats
+
+
+def benchmark(depth=4, worker_counts=(1, 2, 4, 8), position=None):
+    """Time parallel_alpha_beta at a fixed depth for each worker count.
+
+    Returns rows of (workers, seconds, speedup) with speedup measured
+    against a plain serial alpha_beta_search of the same position. One
+    worker runs that same serial search, so its speedup shows the overhead
+    of going through parallel_alpha_beta.
+    """
+    position = position or Board()
+    start = time.perf_counter()
+    alpha_beta_search(position, depth, float('-inf'), float('inf'), True,
+                      TranspositionTable(1 << 16), orderer=MoveOrderer())
+    serial = time.perf_counter() - start
+
+    rows = [(0, serial, 1.0)]
+    for workers in worker_counts:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Warm the pool up so process start-up is not part of the timing
+            list(executor.map(abs, range(workers)))
+            start = time.perf_counter()
+            parallel_alpha_beta(position, depth, True, workers, executor)
+            elapsed = time.perf_counter() - start
+        rows.append((workers, elapsed, serial / elapsed))
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark root-parallel alpha-beta against worker count')
+    parser.add_argument('--depth', type=int, default=4)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print(f"depth {args.depth}, {os.cpu_count()} cores")
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8}")
+    for workers, seconds, speedup in benchmark(args.depth, args.workers):
+        print(f"{workers or 'serial':>8} {seconds:9.3f} {speedup:8.2f}x")
@@ -0,0 +1,107 @@
+import json
+import time
+
+
+class SearchStats:
+    """What a search did, filled in when passed to a search as stats=...
+
+    Searches given stats=None skip all of this. nodes counts every
+    position a search visited, the root included, and leaves the ones
+    scored with an evaluation function. The per-ply lists are indexed by
+    distance from the root. Move generation time includes move ordering,
+    since moves are produced lazily as the search asks for them. depths
+    holds one entry per search depth run (one per iteration for iterative
+    deepening), with its node count and time.
+    """
+
+    def __init__(self):
+        self.nodes = 0
+        self.leaves = 0
+        self.nodes_per_ply = []
+        self.cutoffs_per_ply = []
+        self.movegen_seconds = 0.0
+        self.eval_seconds = 0.0
+        self.depths = []
+        self._depth_start = None
+
+    @staticmethod
+    def _count(counts, ply, amount=1):
+        if ply >= len(counts):
+            counts.extend([0] * (ply + 1 - len(counts)))
+        counts[ply] += amount
+
+    def node(self, ply):
+        self.nodes += 1
+        self._count(self.nodes_per_ply, ply)
+
+    def cutoff(self, ply):
+        self._count(self.cutoffs_per_ply, ply)
+
+    def evaluate(self, position, evaluation_function=None):
+        # Scores a leaf with position.evaluate() or evaluation_function(position) and times it
+        start = time.perf_counter()
+        value = position.evaluate() if evaluation_function is None else evaluation_function(position)
+        self.eval_seconds += time.perf_counter() - start
+        self.leaves += 1
+        return value
+
+    def evaluated_batch(self, ply, count, seconds):
+        # count leaves at ply scored in one vectorized call, without being visited one by one
+        self.nodes += count
+        self._count(self.nodes_per_ply, ply, count)
+        self.leaves += count
+        self.eval_seconds += seconds
+
+    def merge(self, other):
+        # Adds the counts of a search run elsewhere, e.g. a root move searched in a worker process
+        self.nodes += other.nodes
+        self.leaves += other.leaves
+        for ply, count in enumerate(other.nodes_per_ply):
+            self._count(self.nodes_per_ply, ply, count)
+        for ply, count in enumerate(other.cutoffs_per_ply):
+            self._count(self.cutoffs_per_ply, ply, count)
+        self.movegen_seconds += other.movegen_seconds
+        self.eval_seconds += other.eval_seconds
+
+    def timed_moves(self, moves):
+        """Yield from a lazy move iterator, timing only the time spent producing moves."""
+        iterator = iter(moves)
+        while True:
+            start = time.perf_counter()
+            move = next(iterator, None)
+            self.movegen_seconds += time.perf_counter() - start
+            if move is None:
+                return
+            yield move
+
+    def begin_depth(self):
+        self._depth_start = (time.perf_counter(), self.nodes)
+
+    def end_depth(self, depth, completed=True):
+        start, nodes = self._depth_start
+        self.depths.append({'depth': depth, 'nodes': self.nodes - nodes,
+                            'seconds': time.perf_counter() - start, 'completed': completed})
+
+    def effective_branching_factor(self):
+        """Node ratio of the last two completed iterations, or nodes ** (1 / depth) for a single search."""
+        completed = [entry for entry in self.depths if entry['completed']]
+        if len(completed) >= 2 and completed[-2]['nodes']:
+            return completed[-1]['nodes'] / completed[-2]['nodes']
+        depth = len(self.nodes_per_ply) - 1
+        return self.nodes ** (1 / depth) if depth > 0 else 0.0
+
+    def to_dict(self):
+        return {
+            'nodes': self.nodes, 'leaves': self.leaves,
+            'nodes_per_ply': self.nodes_per_ply, 'cutoffs_per_ply': self.cutoffs_per_ply,
+            'effective_branching_factor': self.effective_branching_factor(),
+            'movegen_seconds': self.movegen_seconds, 'eval_seconds': self.eval_seconds,
+            'depths': self.depths,
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def summary(self):
+        return (f"{self.nodes} nodes, {self.leaves} leaves, EBF {self.effective_branching_factor():.2f}, "
+                f"movegen {self.movegen_seconds * 1000:.1f} ms, eval {self.eval_seconds * 1000:.1f} ms")
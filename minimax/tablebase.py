@@ -0,0 +1,440 @@
+import argparse
+import itertools
+import math
+import os
+import time
+import numpy as np
+from checkers.constants import ROWS, COLS, RED, WHITE, SOLDIER, QUEEN, KING, DIRECTIONS
+
+# Endgame tablebases: for every material signature up to a few pieces, the
+# win/draw/loss value and distance to the end of the game of each position.
+#
+# A signature is a tuple of (color, type) pieces in canonical order (WHITE
+# before RED, soldier before queen before king). On disk a position has a
+# gap-free index (see position_index): each run of identical pieces is a
+# combination of the squares the earlier runs left free, so overlapping
+# pieces and reorderings of identical pieces take no entries. Entry
+# index * 2 + side (0 when WHITE is to move, 1 when RED is). Files store
+# the values bit-packed (2 bits per entry) followed by the distances
+# bit-packed at the width the table's longest distance needs.
+#
+# The builder works on the simpler dense index sum(square_i * 81**i),
+# where a move only adds a multiple of 81**i, and compacts when saving.
+
+SQUARES = ROWS * COLS
+COLORS = (WHITE, RED)
+TYPES = (SOLDIER, QUEEN, KING)
+LETTERS = {SOLDIER: 'S', QUEEN: 'Q', KING: 'K'}
+
+# Values, from the point of view of the side to move
+DRAW, WIN, LOSS, INVALID = 0, 1, 2, 3
+
+MAGIC = b'CKTB'
+TABLEBASE_VERSION = 2
+HEADER_SIZE = 8
+TABLEBASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tablebases')
+MAX_DISTANCE = 255
+
+# Search scores for tablebase results: far outside the material range, and a
+# quicker win (or slower loss) scores better
+TB_WIN = 1000
+
+
+def piece_order(piece):
+    color, piece_type = piece
+    return COLORS.index(color), TYPES.index(piece_type)
+
+
+def signature_name(signature):
+    white = ''.join(LETTERS[t] for c, t in signature if c == WHITE)
+    red = ''.join(LETTERS[t] for c, t in signature if c == RED)
+    return f"{white}_{red.lower()}"
+
+
+def signatures(max_pieces):
+    """Every signature with one to max_pieces - 1 pieces a side, in build order.
+
+    A signature only depends on signatures with fewer pieces (captures) or
+    fewer non-king pieces (promotions), so those come first.
+    """
+    result = []
+    for count in range(2, max_pieces + 1):
+        for white_count in range(1, count):
+            for white in itertools.combinations_with_replacement(TYPES, white_count):
+                for red in itertools.combinations_with_replacement(TYPES, count - white_count):
+                    result.append(tuple((WHITE, t) for t in white) + tuple((RED, t) for t in red))
+    return sorted(result, key=lambda s: (len(s), sum(t != KING for _, t in s)))
+
+
+def position_pieces(position):
+    """(color, type, square) of every piece on a Board or BitBoard."""
+    if hasattr(position, 'masks'):
+        pieces = []
+        for index, mask in enumerate(position.masks):
+            color, piece_type = COLORS[index // 3], TYPES[index % 3]
+            while mask:
+                low = mask & -mask
+                pieces.append((color, piece_type, low.bit_length() - 1))
+                mask ^= low
+        return pieces
+    return [(piece.color, piece.type, piece.row * COLS + piece.col)
+            for row in position.board for piece in row if piece != 0]
+
+
+def runs(signature):
+    # Lengths of the runs of identical pieces in a canonical signature
+    return [len(list(run)) for _, run in itertools.groupby(signature)]
+
+
+def table_size(signature):
+    """Number of distinct positions of a signature, ignoring the side to move."""
+    size, free = 1, SQUARES
+    for count in runs(signature):
+        size *= math.comb(free, count)
+        free -= count
+    return size
+
+
+def position_index(signature, squares):
+    """Gap-free index in [0, table_size(signature)) of squares given in signature order.
+
+    The squares of each run are renumbered among the squares no earlier
+    run occupies and ranked as a combination (sum of comb(square, j + 1)
+    over the sorted squares); the run ranks form a mixed-radix number.
+    """
+    index, radix, free, start = 0, 1, SQUARES, 0
+    taken = []
+    for count in runs(signature):
+        group = sorted(squares[start:start + count])
+        rank = 0
+        for j, square in enumerate(group):
+            rank += math.comb(square - sum(t < square for t in taken), j + 1)
+        index += rank * radix
+        radix *= math.comb(free, count)
+        free -= count
+        start += count
+        taken.extend(group)
+    return index
+
+
+def _position_indices(signature, squares):
+    # position_index over arrays of squares, one array per piece
+    index = np.zeros(len(squares[0]), dtype=np.int64)
+    radix, free, start = 1, SQUARES, 0
+    taken = []
+    for count in runs(signature):
+        group = np.sort(np.stack(squares[start:start + count]).astype(np.int64), axis=0)
+        rank = np.zeros_like(index)
+        for j in range(count):
+            renumbered = group[j] - sum((t < group[j]).astype(np.int64) for t in taken)
+            rank += np.array([math.comb(square, j + 1) for square in range(SQUARES)], dtype=np.int64)[renumbered]
+        index += rank * radix
+        radix *= math.comb(free, count)
+        free -= count
+        start += count
+        taken.extend(group)
+    return index
+
+
+def canonical(pieces):
+    # (signature, position_index) of a list of (color, type, square)
+    pieces = sorted(pieces, key=lambda p: piece_order(p[:2]))
+    signature = tuple((color, piece_type) for color, piece_type, _ in pieces)
+    return signature, position_index(signature, [square for _, _, square in pieces])
+
+
+# ---------------------------------------------------------------------------
+# Probing
+
+class Tablebase:
+    """Lazily loaded set of tablebase files, probed by the searches."""
+
+    def __init__(self, directory=TABLEBASE_DIR):
+        self.directory = directory
+        self.tables = {}
+        self.max_pieces = None
+        self.hits = 0
+
+    def _scan(self):
+        # The largest signature on disk decides which positions are worth probing
+        self.max_pieces = 0
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith('.tb'):
+                self.max_pieces = max(self.max_pieces, len(name) - len('_.tb'))
+
+    def _table(self, signature):
+        if signature not in self.tables:
+            path = os.path.join(self.directory, signature_name(signature) + '.tb')
+            self.tables[signature] = load_table(path, signature)
+        return self.tables[signature]
+
+    def probe(self, position, color):
+        """(value, distance) for color to move in position, or None when not covered."""
+        if self.max_pieces is None:
+            self._scan()
+        if position.red_left + position.white_left > self.max_pieces or \
+                position.red_left == 0 or position.white_left == 0:
+            return None
+        signature, index = canonical(position_pieces(position))
+        table = self._table(signature)
+        if table is None:
+            return None
+        entry = index * 2 + COLORS.index(color)
+        packed, distances, bits = table
+        value = (int(packed[entry >> 2]) >> ((entry & 3) * 2)) & 3
+        offset = entry * bits
+        # bits <= 8, so a distance never spans more than two bytes
+        pair = int(distances[offset >> 3]) | int(distances[(offset >> 3) + 1]) << 8
+        self.hits += 1
+        return value, (pair >> (offset & 7)) & ((1 << bits) - 1)
+
+    def score(self, position, color, ply=0):
+        """Search score (WHITE's point of view) of a covered position, or None."""
+        result = self.probe(position, color)
+        if result is None or result[0] == INVALID:
+            return None
+        value, distance = result
+        if value == DRAW:
+            return 0
+        score = TB_WIN - ply - distance
+        if value == LOSS:
+            score = -score
+        return score if color == WHITE else -score
+
+    def best_move(self, position, color):
+        """(score, move) of the move the tablebase prefers, or None when not covered."""
+        if self.score(position, color) is None:
+            return None
+        best = None
+        next_color = RED if color == WHITE else WHITE
+        for move in position.legal_moves(color):
+            undo = position.make_move(move)
+            try:
+                winner = position.winner()
+                if winner is not None:
+                    score = TB_WIN - 1 if winner == WHITE else -(TB_WIN - 1)
+                else:
+                    score = self.score(position, next_color, 1)
+            finally:
+                position.unmake_move(undo)
+            if score is None:
+                return None
+            if best is None or (score > best[0] if color == WHITE else score < best[0]):
+                best = (score, move)
+        return best
+
+
+def load_table(path, signature):
+    # (packed values, packed distances, distance bits) as read-only memory maps, or None
+    entries = table_size(signature) * 2
+    try:
+        header = np.fromfile(path, dtype=np.uint8, count=HEADER_SIZE)
+        if len(header) < HEADER_SIZE or header[:4].tobytes() != MAGIC or \
+                int(header[4]) != TABLEBASE_VERSION or int(header[5]) != len(signature):
+            return None
+        data = np.memmap(path, dtype=np.uint8, mode='r')
+    except (OSError, ValueError):
+        return None
+    bits = int(header[6])
+    packed_size = (entries + 3) // 4
+    # One spare byte so a distance can always be read as a byte pair
+    if not 1 <= bits <= 8 or len(data) != HEADER_SIZE + packed_size + (entries * bits + 7) // 8 + 1:
+        return None
+    return data[HEADER_SIZE:HEADER_SIZE + packed_size], data[HEADER_SIZE + packed_size:], bits
+
+
+def save_table(path, signature, values, distances):
+    # values and distances have shape (2, 81**n): [side][dense index]
+    n = len(signature)
+    dense = np.arange(SQUARES ** n, dtype=np.int64)
+    squares = [(dense // SQUARES ** i) % SQUARES for i in range(n)]
+    # One dense position stands for each stored one: no overlaps, identical pieces in square order
+    keep = values[0] != INVALID
+    start = 0
+    for count in runs(signature):
+        for i in range(start, start + count - 1):
+            keep &= squares[i] < squares[i + 1]
+        start += count
+    order = np.argsort(_position_indices(signature, [square[keep] for square in squares]))
+    assert len(order) == table_size(signature)
+    values = values[:, keep][:, order].T.reshape(-1)
+    distances = np.minimum(distances[:, keep][:, order].T.reshape(-1), MAX_DISTANCE)
+
+    padded = np.zeros((len(values) + 3) // 4 * 4, dtype=np.uint8)
+    padded[:len(values)] = values
+    quads = padded.reshape(-1, 4)
+    packed = quads[:, 0] | (quads[:, 1] << 2) | (quads[:, 2] << 4) | (quads[:, 3] << 6)
+    bits = max(int(distances.max()), 1).bit_length()
+    distance_bits = (distances[:, np.newaxis] >> np.arange(bits)) & 1
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC + bytes([TABLEBASE_VERSION, n, bits, 0]))
+        f.write(packed.astype(np.uint8).tobytes())
+        f.write(np.packbits(distance_bits.astype(np.uint8).reshape(-1), bitorder='little').tobytes())
+        f.write(bytes(1))
+    os.replace(tmp_path, path)
+
+
+# ---------------------------------------------------------------------------
+# Generation
+
+def _destinations():
+    # (color, type) -> one array per direction: target square of each square, -1 off the board
+    rows, cols = np.divmod(np.arange(SQUARES), COLS)
+    result = {}
+    for key, directions in DIRECTIONS.items():
+        result[key] = []
+        for dr, dc in directions:
+            r, c = rows + dr, cols + dc
+            on_board = (r >= 0) & (r < ROWS) & (c >= 0) & (c < COLS)
+            result[key].append(np.where(on_board, r * COLS + c, -1))
+    return result
+
+
+def build_table(signature, solved):
+    """Values and distances, each shape (2, 81**n), of one signature.
+
+    Plain value iteration over distances: a position is won in d plies when
+    some move reaches a position lost in d - 1, and lost in d when every
+    move reaches a position won in under d. A side without a legal move
+    has lost, as in the searches. Captures and promotions leave the
+    signature and are looked up in `solved`, {signature: (values, distances)}.
+    Whatever is still undecided at the end is a draw.
+    """
+    n = len(signature)
+    size = SQUARES ** n
+    index = np.arange(size, dtype=np.int32)
+    squares = [(index // SQUARES ** i) % SQUARES for i in range(n)]
+    valid = np.ones(size, dtype=bool)
+    for i, j in itertools.combinations(range(n), 2):
+        valid &= squares[i] != squares[j]
+
+    values = np.where(valid, DRAW, INVALID).astype(np.uint8)[np.newaxis].repeat(2, axis=0)
+    distances = np.zeros((2, size), dtype=np.uint16)
+    move_counts = np.zeros((2, size), dtype=np.int32)
+    # Per side: moves staying in this signature as (mask, child index), and
+    # moves leaving it as (positions, child value, child distance)
+    internal = ([], [])
+    external = ([], [])
+    longest_external = 0
+    destinations = _destinations()
+
+    for side, color in enumerate(COLORS):
+        own = [j for j, (c, _) in enumerate(signature) if c == color]
+        enemies = [j for j, (c, _) in enumerate(signature) if c != color]
+        for i in own:
+            piece_type = signature[i][1]
+            for target in destinations[signature[i]]:
+                to = target[squares[i]]
+                legal = valid & (to >= 0)
+                for j in own:
+                    if j != i:
+                        legal &= to != squares[j]
+                move_counts[side] += legal
+                promoted = (to // COLS == 0) | (to // COLS == ROWS - 1) if piece_type != KING else \
+                    np.zeros(size, dtype=bool)
+                captured = np.full(size, -1, dtype=np.int8)
+                for j in enemies:
+                    captured[legal & (to == squares[j])] = j
+
+                quiet = legal & (captured < 0) & ~promoted
+                internal[side].append((quiet, np.where(quiet, index + (to - squares[i]) * SQUARES ** i, 0)))
+
+                for j in [-1] + enemies:
+                    for promote in (True, False):
+                        if j < 0 and not promote:
+                            continue
+                        positions = np.nonzero(legal & (captured == j) & (promoted == promote))[0]
+                        if len(positions) == 0:
+                            continue
+                        child_values, child_distances = _external_children(
+                            signature, solved, side, i, j, promote, positions, squares, to)
+                        external[side].append((positions, child_values, child_distances))
+                        longest_external = max(longest_external, int(child_distances.max()))
+
+    # Distance 0: no legal move
+    for side in range(2):
+        stuck = (values[side] == DRAW) & (move_counts[side] == 0)
+        values[side][stuck] = LOSS
+
+    level = 0
+    while True:
+        level += 1
+        before_values, before_distances = values.copy(), distances.copy()
+        changed = False
+        for side in range(2):
+            other = 1 - side
+            wins = np.zeros(size, dtype=bool)
+            won_children = np.zeros(size, dtype=np.int32)
+            for mask, child in internal[side]:
+                child_values = before_values[other][child]
+                wins |= mask & (child_values == LOSS) & (before_distances[other][child] == level - 1)
+                won_children += mask & (child_values == WIN)
+            for positions, child_values, child_distances in external[side]:
+                wins[positions] |= (child_values == LOSS) & (child_distances == level - 1)
+                won_children[positions] += (child_values == WIN) & (child_distances <= level - 1)
+
+            undecided = before_values[side] == DRAW
+            new_wins = undecided & wins
+            new_losses = undecided & ~wins & (move_counts[side] > 0) & (won_children == move_counts[side])
+            values[side][new_wins] = WIN
+            values[side][new_losses] = LOSS
+            distances[side][new_wins | new_losses] = level
+            changed = changed or new_wins.any() or new_losses.any()
+        if not changed and level > longest_external + 1:
+            break
+    return values, distances
+
+
+def _external_children(signature, solved, side, mover, captured, promote, positions, squares, to):
+    # Value and distance of the positions reached by a capture and/or promotion
+    pieces = []
+    for k, (color, piece_type) in enumerate(signature):
+        if k == captured:
+            continue
+        if k == mover:
+            pieces.append((color, KING if promote else piece_type, to[positions]))
+        else:
+            pieces.append((color, piece_type, squares[k][positions]))
+    if all(color == COLORS[side] for color, _, _ in pieces):
+        # The last enemy piece was taken: the opponent, to move, has lost
+        return np.full(len(positions), LOSS, dtype=np.uint8), np.zeros(len(positions), dtype=np.uint16)
+    pieces.sort(key=lambda p: piece_order(p[:2]))
+    child_signature = tuple((color, piece_type) for color, piece_type, _ in pieces)
+    child_index = np.zeros(len(positions), dtype=np.int64)
+    for k, (_, _, child_squares) in enumerate(pieces):
+        child_index += child_squares.astype(np.int64) * SQUARES ** k
+    child_values, child_distances = solved[child_signature]
+    return child_values[1 - side][child_index], child_distances[1 - side][child_index]
+
+
+def build_all(max_pieces=3, directory=TABLEBASE_DIR, progress=None):
+    """Build and save the tables of every signature with up to max_pieces pieces."""
+    os.makedirs(directory, exist_ok=True)
+    solved = {}
+    for signature in signatures(max_pieces):
+        start = time.perf_counter()
+        solved[signature] = build_table(signature, solved)
+        save_table(os.path.join(directory, signature_name(signature) + '.tb'), signature, *solved[signature])
+        if progress:
+            progress(signature, solved[signature], time.perf_counter() - start)
+    return solved
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build win/draw/loss and distance-to-win endgame tablebases')
+    parser.add_argument('--pieces', type=int, default=3, help='largest number of pieces on the board')
+    parser.add_argument('--output', default=TABLEBASE_DIR)
+    args = parser.parse_args()
+
+    def report(signature, table, seconds):
+        values, distances = table
+        counts = np.bincount(values.reshape(-1), minlength=4)
+        print(f"{signature_name(signature):>6}: {counts[WIN]} won, {counts[DRAW]} drawn, {counts[LOSS]} lost, "
+              f"longest {distances.max()} plies, {seconds:.1f} s")
+
+    build_all(args.pieces, args.output, report)
@@ -0,0 +1,49 @@
+from checkers.zobrist import SIDE_KEY
+
+# Bound types stored with each entry
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class TranspositionTable:
+    """Fixed-size hash table of search results keyed by Zobrist hash.
+
+    Each slot holds (key, depth, flag, value, move, age). A slot is
+    replaced when it is empty, left over from an earlier search, or the
+    new result was searched at least as deep (depth-preferred).
+    """
+
+    def __init__(self, size=1 << 18):
+        self.size = size
+        self.entries = [None] * size
+        self.age = 0
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def key(position, max_player):
+        return position.hash if max_player else position.hash ^ SIDE_KEY
+
+    def new_search(self):
+        # Entries from earlier searches stay usable but become replaceable
+        self.age += 1
+
+    def probe(self, key):
+        entry = self.entries[key % self.size]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, key, depth, flag, value, move):
+        index = key % self.size
+        entry = self.entries[index]
+        if entry is None or entry[5] != self.age or depth >= entry[1]:
+            self.entries[index] = (key, depth, flag, value, move, self.age)
+
+    def clear(self):
+        self.entries = [None] * self.size
+        self.hits = self.misses = 0
+
+    def hit_rate(self):
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
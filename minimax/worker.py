@@ -0,0 +1,65 @@
+import queue
+import threading
+from copy import deepcopy
+from minimax.algorithm import SearchAborted
+
+# Returned by SearchWorker.poll while the search is still running
+PENDING = object()
+
+
+class SearchWorker:
+    """Runs one engine search at a time on a background thread.
+
+    The game loop starts a search with start(), checks poll() once per
+    frame and keeps drawing in between. cancel() stops the running search
+    at its next node and drops its result. The search gets its own copy of
+    the board, so the UI can keep drawing the real one meanwhile. An
+    exception raised by the search is raised again from poll(), so a
+    failing engine stops the game instead of being restarted every frame.
+    """
+
+    def __init__(self):
+        self.results = queue.Queue()
+        self.thread = None
+        self.stop = None
+        self.job = 0
+
+    def start(self, search, position, *args, **kwargs):
+        """Run search(copy_of_position, *args, stop=event, **kwargs) in the background."""
+        self.cancel()
+        self.job += 1
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True,
+                                       args=(self.job, self.stop, search, deepcopy(position), args, kwargs))
+        self.thread.start()
+
+    def _run(self, job, stop, search, position, args, kwargs):
+        try:
+            result = search(position, *args, stop=stop, **kwargs)
+        except SearchAborted:
+            return
+        except Exception as error:
+            self.results.put((job, None, error))
+            return
+        self.results.put((job, result, None))
+
+    def busy(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def poll(self):
+        while True:
+            try:
+                job, result, error = self.results.get_nowait()
+            except queue.Empty:
+                return PENDING
+            # Results of cancelled searches can still arrive; skip them
+            if job == self.job and not self.stop.is_set():
+                self.thread = None
+                if error is not None:
+                    raise error
+                return result
+
+    def cancel(self):
+        if self.stop is not None:
+            self.stop.set()
+        self.thread = None
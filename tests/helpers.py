@@ -0,0 +1,32 @@
+import random
+from copy import deepcopy
+from checkers.constants import RED, WHITE
+from minimax.bench import positions
+
+# Shared by the test modules; pytest puts this directory on sys.path
+
+
+def other(color):
+    return RED if color == WHITE else WHITE
+
+
+def snapshot(board):
+    pieces = [[(piece.color, piece.type, piece.row, piece.col) if piece != 0 else 0 for piece in row]
+              for row in board.board]
+    return pieces, board.hash, board.material, board.red_left, board.white_left, board.red_kings, board.white_kings
+
+
+def random_positions(count, seed=1):
+    # (board, side to move) reached by random play from the benchmark positions
+    rng = random.Random(seed)
+    start = list(positions().values())
+    for _ in range(count):
+        board, color = start[rng.randrange(len(start))]
+        board = deepcopy(board)
+        for _ in range(rng.randrange(30)):
+            moves = board.legal_moves(color)
+            if not moves or board.winner() is not None:
+                break
+            board.make_move(rng.choice(moves))
+            color = other(color)
+        yield board, color
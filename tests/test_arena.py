@@ -0,0 +1,20 @@
+from minimax import arena
+
+
+def white_wins(white, red, max_moves, seed, log=None):
+    return {'winner': 'white', 'plies': 1, 'material': 0,
+            'white_seconds': 0.0, 'white_moves': 1, 'red_seconds': 0.0, 'red_moves': 0}
+
+
+def test_colors_alternate_in_self_play(monkeypatch):
+    # The pool's forked workers see the patched function
+    monkeypatch.setattr(arena, 'play_game', white_wins)
+    summary = arena.run_match('alpha_beta:1', 'alpha_beta:1', games=6, workers=1)
+    assert (summary['wins'], summary['draws'], summary['losses']) == (3, 0, 3)
+    assert summary['score'] == 0.5 and summary['elo'] == 0
+
+
+def test_match_between_two_engines():
+    summary = arena.run_match('alpha_beta:1', 'minimax:1', games=2, workers=1, max_moves=40)
+    assert summary['wins'] + summary['draws'] + summary['losses'] == 2
+    assert set(summary['ms_per_move']) == {'alpha_beta:1', 'minimax:1'}
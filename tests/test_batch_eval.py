@@ -0,0 +1,29 @@
+import random
+import numpy as np
+from helpers import random_positions
+from minimax.batch_eval import encode_board, encode_children, get_batch_evaluation_function
+from minimax.genetic_algorithm import get_optimized_evaluation_function
+
+
+def test_batch_matches_scalar_evaluation():
+    rng = random.Random(17)
+    for board, _ in random_positions(300, seed=18):
+        params = {'soldier': rng.uniform(0.5, 2), 'queen': rng.uniform(2, 4), 'king': rng.uniform(4, 6)}
+        batch_scores = get_batch_evaluation_function(params)(encode_board(board)[np.newaxis])
+        assert batch_scores.shape == (1,)
+        assert abs(batch_scores[0] - get_optimized_evaluation_function(params)(board)) < 1e-9
+
+
+def test_children_batch_matches_child_boards():
+    params = {'soldier': 1, 'queen': 3, 'king': 5}
+    evaluation_function = get_optimized_evaluation_function(params)
+    batch_evaluation = get_batch_evaluation_function(params)
+    for board, color in random_positions(100, seed=19):
+        moves = board.legal_moves(color)
+        if not moves:
+            continue
+        batch = encode_children(board, moves)
+        for cells, move in zip(batch, moves):
+            assert (cells == encode_board(board.child(move))).all()
+        expected = [evaluation_function(board.child(move)) for move in moves]
+        assert np.allclose(batch_evaluation(batch), expected, rtol=0, atol=1e-9)
@@ -0,0 +1,50 @@
+import random
+from checkers.bitboard import BitBoard
+from checkers.constants import WHITE
+from helpers import other, random_positions, snapshot
+from minimax.algorithm import alpha_beta_minimax
+from minimax.bench import perft, positions
+
+
+def test_bitboard_matches_board():
+    rng = random.Random(6)
+    for board, color in random_positions(100, seed=7):
+        bitboard = BitBoard.from_board(board)
+        for _ in range(20):
+            moves = board.legal_moves(color)
+            assert sorted(bitboard.legal_moves(color)) == sorted(moves)
+            if not moves or board.winner() is not None:
+                break
+            move = rng.choice(moves)
+            board.make_move(move)
+            bitboard.make_move(move)
+            assert (bitboard.hash, bitboard.material, bitboard.red_left, bitboard.white_left) == \
+                (board.hash, board.material, board.red_left, board.white_left)
+            color = other(color)
+        assert snapshot(bitboard.to_board())[:5] == snapshot(board)[:5]
+
+
+def test_bitboard_make_unmake_restores_position():
+    rng = random.Random(9)
+    for board, color in random_positions(50, seed=10):
+        bitboard = BitBoard.from_board(board)
+        before = (bitboard.masks[:], bitboard.squares[:], bitboard.hash, bitboard.material)
+        undos = []
+        for _ in range(20):
+            moves = bitboard.legal_moves(color)
+            if not moves or bitboard.winner() is not None:
+                break
+            undos.append(bitboard.make_move(rng.choice(moves)))
+            color = other(color)
+        while undos:
+            bitboard.unmake_move(undos.pop())
+        assert (bitboard.masks, bitboard.squares, bitboard.hash, bitboard.material) == before
+
+
+def test_perft_and_search_agree_with_board():
+    for board, color in positions().values():
+        assert perft(BitBoard.from_board(board), 3, color) == perft(board, 3, color)
+        with_board = alpha_beta_minimax(board, 3, float('-inf'), float('inf'), color == WHITE, None)
+        with_bitboard = alpha_beta_minimax(board, 3, float('-inf'), float('inf'), color == WHITE, None, bitboard=True)
+        # Move order may differ, which can pick a different move of equal score
+        assert with_bitboard[0] == with_board[0]
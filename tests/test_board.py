@@ -0,0 +1,118 @@
+import random
+import pytest
+from checkers.board import Board, PACKED_SIZE
+from checkers.constants import RED, WHITE
+from checkers.zobrist import hash_board
+from helpers import other, random_positions, snapshot
+from minimax.algo import minimax_search
+from minimax.algorithm import alpha_beta_search
+from minimax.ga_minimax import GA_minimax_search
+from minimax.genetic_algorithm import get_optimized_evaluation_function
+
+
+def test_bytes_and_fen_round_trip():
+    for board, color in random_positions(600):
+        data = board.to_bytes(color)
+        assert len(data) == PACKED_SIZE
+        for decoded in (Board.from_bytes(data), Board.from_fen(board.to_fen(color))):
+            assert decoded.turn == color
+            assert decoded.to_bytes(color) == data
+            pieces, hash_value, material, red_left, white_left, _, _ = snapshot(board)
+            assert snapshot(decoded)[:5] == (pieces, hash_value, material, red_left, white_left)
+
+
+def test_side_to_move_is_encoded():
+    board = Board()
+    assert board.to_bytes(RED) != board.to_bytes(WHITE)
+    assert board.to_fen(RED).endswith(' r') and board.to_fen(WHITE).endswith(' w')
+
+
+@pytest.mark.parametrize('data', [b'\0' * (PACKED_SIZE - 1), b'\xff' * PACKED_SIZE])
+def test_from_bytes_rejects_bad_input(data):
+    with pytest.raises(ValueError):
+        Board.from_bytes(data)
+
+
+@pytest.mark.parametrize('fen', ['', '9/9 w', '9/9/9/9/9/9/9/9/9 x', '9/9/9/9/9/9/9/9/X8 w', '9/9/9/9/9/9/9/9/8 w'])
+def test_from_fen_rejects_bad_input(fen):
+    with pytest.raises(ValueError):
+        Board.from_fen(fen)
+
+
+def test_make_unmake_restores_position():
+    rng = random.Random(2)
+    for board, color in random_positions(100, seed=3):
+        before = snapshot(board)
+        undos = []
+        for _ in range(20):
+            moves = board.legal_moves(color)
+            if not moves or board.winner() is not None:
+                break
+            undos.append(board.make_move(rng.choice(moves)))
+            # The running hash and material match a full rescan after every move
+            assert board.hash == hash_board(board)
+            assert board.material == board.count_material()
+            color = other(color)
+        while undos:
+            board.unmake_move(undos.pop())
+        assert snapshot(board) == before
+
+
+def test_searches_leave_the_board_unchanged():
+    evaluation_function = get_optimized_evaluation_function({'soldier': 1, 'queen': 3, 'king': 5})
+    searches = [
+        lambda board, white: minimax_search(board, 2, white),
+        lambda board, white: alpha_beta_search(board, 3, float('-inf'), float('inf'), white),
+        lambda board, white: GA_minimax_search(board, 3, float('-inf'), float('inf'), white, evaluation_function),
+    ]
+    for board, color in random_positions(10, seed=8):
+        before = snapshot(board)
+        for search in searches:
+            _, move = search(board, color == WHITE)
+            assert move is None or move in board.legal_moves(color)
+            assert snapshot(board) == before
+
+
+def test_running_material_with_check_material(monkeypatch):
+    monkeypatch.setattr(Board, 'CHECK_MATERIAL', True)
+    rng = random.Random(15)
+    captures = promotions = 0
+    for board, color in random_positions(150, seed=16):
+        undos = []
+        for _ in range(40):
+            moves = board.legal_moves(color)
+            if not moves or board.winner() is not None:
+                break
+            move = rng.choice(moves)
+            captures += move[4] is not None
+            piece = board.get_piece(move[0], move[1])
+            piece_type = piece.type
+            undos.append(board.make_move(move))
+            promotions += piece.type != piece_type
+            # evaluate() itself asserts against a rescan in this mode
+            assert board.evaluate() == board.count_material()
+            color = other(color)
+        while undos:
+            board.unmake_move(undos.pop())
+            assert board.evaluate() == board.count_material()
+    assert captures > 100 and promotions > 10
+
+
+def test_check_material_catches_a_stale_score(monkeypatch):
+    monkeypatch.setattr(Board, 'CHECK_MATERIAL', True)
+    board = Board()
+    board.material += 1
+    with pytest.raises(AssertionError):
+        board.evaluate()
+
+
+def test_move_keeps_hash_and_material():
+    rng = random.Random(4)
+    for board, color in random_positions(100, seed=5):
+        moves = board.legal_moves(color)
+        if not moves:
+            continue
+        from_row, from_col, row, col, _ = rng.choice(moves)
+        board.move(board.get_piece(from_row, from_col), row, col)
+        assert board.hash == hash_board(board)
+        assert board.material == board.count_material()
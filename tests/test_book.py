@@ -0,0 +1,42 @@
+from checkers.board import Board
+from checkers.constants import RED, WHITE
+from minimax.book import OpeningBook, build_book, write_book
+from minimax.transposition import TranspositionTable
+
+
+def test_committed_book_covers_the_first_moves():
+    book = OpeningBook()
+    board = Board()
+    move = book.probe(board, RED)
+    assert move in board.legal_moves(RED)
+    # Every first move RED can choose has a WHITE reply in the book
+    for first in board.legal_moves(RED):
+        undo = board.make_move(first)
+        assert book.probe(board, WHITE) in board.legal_moves(WHITE)
+        board.unmake_move(undo)
+
+
+def test_written_book_reads_back(tmp_path):
+    entries = build_book(plies=2, depth=2)
+    path = str(tmp_path / 'book.bin')
+    write_book(entries, path)
+    book = OpeningBook(path)
+    # The file is only mapped on the first lookup
+    assert book.data is None
+    for key, move in entries.items():
+        assert book.lookup(key) == move
+    assert book.count == len(entries)
+    board = Board()
+    assert book.probe(board, RED) == entries[TranspositionTable.key(board, False)]
+    # Out of book: a position the book never reached
+    board.make_move(board.legal_moves(RED)[0])
+    board.make_move(board.legal_moves(WHITE)[0])
+    board.make_move(board.legal_moves(RED)[0])
+    assert book.probe(board, WHITE) is None
+
+
+def test_missing_or_foreign_file_is_an_empty_book(tmp_path):
+    assert OpeningBook(str(tmp_path / 'missing.bin')).probe(Board(), RED) is None
+    foreign = tmp_path / 'foreign.bin'
+    foreign.write_bytes(b'not a book at all')
+    assert OpeningBook(str(foreign)).probe(Board(), RED) is None
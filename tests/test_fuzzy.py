@@ -0,0 +1,75 @@
+import os
+import random
+import subprocess
+import sys
+import numpy as np
+from minimax import fuzzy
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def computed_strength(piece_value, game_phase):
+    fuzzy.move_simulation.input['piece_value'] = piece_value
+    fuzzy.move_simulation.input['game_phase'] = game_phase
+    try:
+        fuzzy.move_simulation.compute()
+        return fuzzy.move_simulation.output['move_strength']
+    except (ValueError, KeyError):
+        # No rule fires here; the table stores 0 as well
+        return 0
+
+
+def test_table_matches_compute_on_the_grid():
+    rng = random.Random(20)
+    # The whole grid takes seconds to compute, so check a sample of it plus the corners
+    points = [(0, 0), (0, fuzzy.TABLE_SIZE - 1), (fuzzy.TABLE_SIZE - 1, 0), (fuzzy.TABLE_SIZE - 1,) * 2]
+    points += [(rng.randrange(fuzzy.TABLE_SIZE), rng.randrange(fuzzy.TABLE_SIZE)) for _ in range(40)]
+    for i, j in points:
+        piece_value, game_phase = i * fuzzy.TABLE_STEP, j * fuzzy.TABLE_STEP
+        assert abs(fuzzy.fuzzy_move_strength(piece_value, game_phase) -
+                   computed_strength(piece_value, game_phase)) < 1e-9, (piece_value, game_phase)
+
+
+def test_between_grid_points_is_interpolated():
+    table = fuzzy.load_move_strength_table()
+    value = fuzzy.fuzzy_move_strength(2.25, 6.25)
+    corners = table[4:6, 12:14]
+    assert corners.min() <= value <= corners.max()
+    assert value == fuzzy.fuzzy_move_strength(2.25, 6.25)
+
+
+def test_rule_set_key_is_stable():
+    key = fuzzy.rule_set_key()
+    assert key == fuzzy.rule_set_key()
+    # The same in a fresh process with different string hashing
+    for seed in ('1', '2'):
+        output = subprocess.run([sys.executable, '-c', 'from minimax import fuzzy; print(fuzzy.rule_set_key())'],
+                                cwd=ROOT, env=dict(os.environ, PYTHONHASHSEED=seed), check=True,
+                                capture_output=True, text=True).stdout
+        assert output.strip() == key
+
+
+def test_rule_set_key_changes_with_the_grid(monkeypatch):
+    key = fuzzy.rule_set_key()
+    monkeypatch.setattr(fuzzy, 'TABLE_STEP', 0.25)
+    assert fuzzy.rule_set_key() != key
+
+
+def test_table_is_cached_on_disk(monkeypatch, tmp_path):
+    built = []
+
+    def build():
+        built.append(1)
+        return np.arange(fuzzy.TABLE_SIZE ** 2, dtype=float).reshape(fuzzy.TABLE_SIZE, fuzzy.TABLE_SIZE)
+
+    monkeypatch.setattr(fuzzy, 'TABLE_DIR', str(tmp_path))
+    monkeypatch.setattr(fuzzy, 'build_move_strength_table', build)
+    first = fuzzy.load_move_strength_table()
+    path = tmp_path / f"fuzzy_table_{fuzzy.rule_set_key()}.npy"
+    assert path.exists() and len(built) == 1
+    # The second load reads the file instead of rebuilding
+    assert (fuzzy.load_move_strength_table() == first).all() and len(built) == 1
+    # A damaged file is rebuilt and replaced
+    path.write_bytes(b'not a table')
+    assert (fuzzy.load_move_strength_table() == first).all() and len(built) == 2
+    assert (np.load(path) == first).all()
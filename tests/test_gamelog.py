@@ -0,0 +1,30 @@
+import pytest
+from checkers.constants import WHITE
+from minimax.arena import play_game
+from minimax.gamelog import read_games, replay
+
+
+@pytest.fixture
+def log(tmp_path):
+    path = str(tmp_path / 'games.jsonl')
+    for seed in range(3):
+        play_game('minimax:1', 'alpha_beta:1', 150, seed, path)
+    return path
+
+
+def test_replay_with_and_without_check_agree(log):
+    games = list(read_games(log))
+    assert len(games) == 3 and all(game['finished'] for game in games)
+    for game in games:
+        checked = [(board.to_fen(WHITE), board.hash, board.material) for board, _ in replay(game)]
+        unchecked = [(board.to_fen(WHITE), board.hash, board.material) for board, _ in replay(game, check=False)]
+        assert checked == unchecked
+        assert len(checked) == len(game['moves'])
+
+
+def test_replay_rejects_an_illegal_move(log):
+    game = next(read_games(log))
+    # Move a piece from the empty middle of the board
+    game['moves'][0] = dict(game['moves'][0], move=[4, 4, 3, 4])
+    with pytest.raises(ValueError):
+        list(replay(game))
@@ -0,0 +1,29 @@
+import random
+import pytest
+from minimax import genetic_algorithm
+
+
+def fake_population_fitness(population, fitness_cache, executor):
+    # Deterministic stand-in for the self-play games
+    return [params['soldier'] + params['queen'] / 3 + params['king'] / 5 for params in population]
+
+
+@pytest.mark.parametrize('seed', range(15))
+def test_resumed_run_matches_straight_run(seed, tmp_path, monkeypatch):
+    monkeypatch.setattr(genetic_algorithm, 'evaluate_population', fake_population_fitness)
+    random.seed(seed)
+    straight = genetic_algorithm.genetic_algorithm(8, 8, 0.5, workers=1)
+
+    checkpoint = str(tmp_path / 'checkpoint.json')
+    random.seed(seed)
+    genetic_algorithm.genetic_algorithm(8, 3, 0.5, workers=1, checkpoint=checkpoint)
+    random.seed(seed + 1000)  # The checkpoint restores the RNG state
+    resumed = genetic_algorithm.genetic_algorithm(8, 8, 0.5, workers=1, checkpoint=checkpoint)
+
+    assert resumed == straight
+
+
+def test_select_returns_a_copy():
+    population = [{'soldier': 1.0, 'queen': 2.0, 'king': 4.0}]
+    picked = genetic_algorithm.select(population, [1.0])
+    assert picked == population[0] and picked is not population[0]
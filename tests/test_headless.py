@@ -0,0 +1,27 @@
+import glob
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Only these draw or play sound and may import pygame
+PYGAME_MODULES = {'checkers.animation', 'checkers.assets', 'checkers.game', 'checkers.render'}
+
+
+def headless_modules():
+    modules = []
+    paths = glob.glob(os.path.join(ROOT, 'checkers', '*.py')) + glob.glob(os.path.join(ROOT, 'minimax', '*.py'))
+    for path in sorted(paths):
+        package, name = os.path.relpath(path, ROOT)[:-3].split(os.sep)
+        if not name.startswith('_') and f'{package}.{name}' not in PYGAME_MODULES:
+            modules.append(f'{package}.{name}')
+    return modules
+
+
+def test_rules_and_engines_import_without_pygame(tmp_path):
+    modules = headless_modules()
+    assert 'checkers.board' in modules and 'minimax.engines' in modules
+    code = f"import sys\nfor name in {modules!r}:\n    __import__(name)\nassert 'pygame' not in sys.modules\n"
+    # Run from an empty directory so nothing can depend on the image and sound files
+    subprocess.run([sys.executable, '-c', code], cwd=tmp_path, check=True,
+                   env=dict(os.environ, PYTHONPATH=ROOT))
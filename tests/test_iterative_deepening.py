@@ -0,0 +1,43 @@
+import threading
+import time
+import pytest
+from checkers.constants import WHITE
+from helpers import snapshot
+from minimax.algorithm import SearchAborted, alpha_beta_minimax, iterative_deepening, iterative_deepening_search
+from minimax.bench import positions
+from minimax.stats import SearchStats
+
+
+@pytest.mark.parametrize('name', ['start', 'midgame'])
+def test_deadline_returns_last_completed_depth(name):
+    board, color = positions()[name]
+    before = snapshot(board)
+    stats = SearchStats()
+    start = time.perf_counter()
+    evaluation, move, completed = iterative_deepening_search(board, 0.2, color == WHITE, stats=stats)
+    elapsed = time.perf_counter() - start
+    # The deadline is checked at every node, so it is overrun by very little
+    assert elapsed < 0.2 + 0.1
+    # The deepest iteration was cut off by SearchAborted and its partial result thrown away
+    assert stats.depths[-1] == dict(stats.depths[-1], depth=completed + 1, completed=False)
+    assert all(entry['completed'] for entry in stats.depths[:-1])
+    assert snapshot(board) == before
+    assert move in board.legal_moves(color)
+    assert evaluation == alpha_beta_minimax(board, completed, float('-inf'), float('inf'), color == WHITE, None)[0]
+
+
+def test_max_depth_ends_the_search_early():
+    board, color = positions()['endgame']
+    start = time.perf_counter()
+    _, new_board, completed = iterative_deepening(board, 10, color == WHITE, max_depth=3)
+    assert completed == 3
+    assert time.perf_counter() - start < 10
+    assert new_board is not board
+
+
+def test_stop_event_aborts():
+    board, color = positions()['start']
+    stop = threading.Event()
+    stop.set()
+    with pytest.raises(SearchAborted):
+        iterative_deepening_search(board, 1, color == WHITE, stop=stop)
@@ -0,0 +1,54 @@
+import random
+from checkers.constants import PIECE_VALUES, WHITE
+from helpers import random_positions
+from minimax.algorithm import alpha_beta_search
+from minimax.ordering import MoveOrderer
+
+
+def test_captures_then_killers_then_history():
+    rng = random.Random(12)
+    checked = 0
+    for board, color in random_positions(200, seed=13):
+        moves = board.legal_moves(color)
+        quiet = [move for move in moves if move[4] is None]
+        captures = [move for move in moves if move[4] is not None]
+        if len(quiet) < 4 or not captures:
+            continue
+        orderer = MoveOrderer()
+        killers = rng.sample(quiet, 2)
+        orderer.killers[3] = killers[:]
+        for move in quiet:
+            orderer.history[move] = rng.randrange(100)
+
+        ordered = list(orderer.ordered_moves(board, color, 3))
+        assert sorted(ordered) == sorted(moves)
+        # Most valuable victim first
+        head = ordered[:len(captures)]
+        assert all(move[4] is not None for move in head)
+        assert [PIECE_VALUES[move[4]] for move in head] == sorted((PIECE_VALUES[move[4]] for move in head),
+                                                                  reverse=True)
+        assert ordered[len(captures):len(captures) + 2] == killers
+        rest = ordered[len(captures) + 2:]
+        assert [orderer.history[move] for move in rest] == sorted((orderer.history[move] for move in rest),
+                                                                  reverse=True)
+
+        # A hash move goes ahead of everything and is not repeated
+        tt_move = quiet[-1]
+        ordered = list(orderer.ordered_moves(board, color, 3, tt_move))
+        assert ordered[0] == tt_move and sorted(ordered) == sorted(moves)
+        checked += 1
+    assert checked > 10
+
+
+def test_ordered_search_matches_unordered():
+    orderer = MoveOrderer()
+    for board, color in random_positions(30, seed=14):
+        for depth in (1, 2, 3, 4):
+            orderer.new_search()
+            ordered = alpha_beta_search(board, depth, float('-inf'), float('inf'), color == WHITE, orderer=orderer)
+            unordered = alpha_beta_search(board, depth, float('-inf'), float('inf'), color == WHITE)
+            assert ordered[0] == unordered[0], board.to_fen(color)
+    assert orderer.cutoffs > 0
+    assert 0 < orderer.first_move_cutoffs <= orderer.cutoffs
+    assert orderer.first_move_cutoff_rate() == orderer.first_move_cutoffs / orderer.cutoffs
+    assert orderer.history
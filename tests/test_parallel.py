@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from checkers.constants import WHITE
+from minimax.algorithm import alpha_beta_search
+from minimax.bench import positions
+from minimax.engines import get_engine
+from minimax.ordering import MoveOrderer
+from minimax.parallel import parallel_alpha_beta_search
+from minimax.stats import SearchStats
+from minimax.transposition import TranspositionTable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='module')
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize('name', ['start', 'midgame', 'endgame'])
+def test_parallel_matches_serial(executor, name):
+    board, color = positions()[name]
+    serial, _ = alpha_beta_search(board, 3, float('-inf'), float('inf'), color == WHITE,
+                                  TranspositionTable(1 << 16), orderer=MoveOrderer())
+    stats = SearchStats()
+    evaluation, move = parallel_alpha_beta_search(board, 3, color == WHITE, 2, executor, stats)
+    assert evaluation == serial
+    assert move in board.legal_moves(color)
+    # Nodes searched in the workers are counted too
+    assert stats.nodes > len(board.legal_moves(color))
+    assert parallel_alpha_beta_search(board, 3, color == WHITE, workers=1)[0] == serial
+
+
+def test_registered_as_engine():
+    board, color = positions()['midgame']
+    assert get_engine('parallel_alpha_beta:2')(board, color) in board.legal_moves(color)
+
+
+@pytest.mark.parametrize('code', [
+    # Arena workers search serially rather than starting pools that would block their exit
+    "arena.run_match('parallel_alpha_beta:2', 'alpha_beta:1', 2, workers=2)",
+    # The engine's own pool is shut down when the program exits
+    "engines.play_parallel_alpha_beta(Board(), RED, 2)",
+])
+def test_parallel_engine_lets_the_process_exit(code):
+    setup = ("from checkers.board import Board; from checkers.constants import RED; "
+             "from minimax import arena, engines; engines.PARALLEL_WORKERS = 2; ")
+    subprocess.run([sys.executable, '-c', setup + code], check=True, timeout=60, cwd=ROOT)
@@ -0,0 +1,36 @@
+import os
+import random
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+pygame = pytest.importorskip('pygame')
+
+from checkers.board import Board
+from checkers.constants import ROWS, COLS, SQUARE_SIZE, RED, WHITE
+from checkers.render import BoardRenderer
+
+
+def test_incremental_draw_matches_full_redraw():
+    pygame.display.init()
+    try:
+        size = (COLS * SQUARE_SIZE, ROWS * SQUARE_SIZE)
+        win = pygame.display.set_mode(size)
+        full = pygame.Surface(size)
+        renderer = BoardRenderer(win)
+        rng = random.Random(1)
+        board, color = Board(), RED
+        for _ in range(40):
+            moves = board.legal_moves(color)
+            if not moves or board.winner() is not None:
+                break
+            # Show the dots of one piece, as when the player selects it
+            from_row, from_col = rng.choice(moves)[:2]
+            valid_moves = {(move[2], move[3]): move[4] for move in moves if move[:2] == (from_row, from_col)}
+            renderer.draw(board, valid_moves)
+            BoardRenderer(full).draw(board, valid_moves)
+            assert pygame.image.tobytes(win, 'RGB') == pygame.image.tobytes(full, 'RGB')
+            board.make_move(rng.choice(moves))
+            color = WHITE if color == RED else RED
+    finally:
+        pygame.display.quit()
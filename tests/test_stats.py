@@ -0,0 +1,65 @@
+import json
+import random
+import pytest
+from checkers.constants import WHITE
+from minimax.algo import minimax_search
+from minimax.algorithm import alpha_beta_search, iterative_deepening_search
+from minimax.bench import positions
+from minimax.engines import ENGINES
+from minimax.ga_minimax import GA_minimax_search
+from minimax.genetic_algorithm import get_optimized_evaluation_function
+from minimax.ordering import MoveOrderer
+from minimax.stats import SearchStats
+from minimax.transposition import TranspositionTable
+
+EVALUATION_FUNCTION = get_optimized_evaluation_function({'soldier': 1, 'queen': 3, 'king': 5})
+SEARCHES = {
+    'minimax': lambda board, white, stats: minimax_search(board, 2, white, stats=stats),
+    'alpha_beta': lambda board, white, stats: alpha_beta_search(
+        board, 3, float('-inf'), float('inf'), white, TranspositionTable(1 << 16), orderer=MoveOrderer(), stats=stats),
+    'iterative': lambda board, white, stats: iterative_deepening_search(
+        board, 60, white, max_depth=3, tt=TranspositionTable(1 << 16), stats=stats),
+    'ga_minimax': lambda board, white, stats: GA_minimax_search(
+        board, 3, float('-inf'), float('inf'), white, EVALUATION_FUNCTION, stats=stats),
+}
+
+
+def seeded(function, *args, **kwargs):
+    # GA minimax and fuzzy break ties and perturb scores at random; both runs get the same draws
+    random.seed(0)
+    return function(*args, **kwargs)
+
+
+@pytest.mark.parametrize('search', SEARCHES)
+@pytest.mark.parametrize('name', ['start', 'midgame', 'endgame'])
+def test_stats_do_not_change_the_search(search, name):
+    board, color = positions()[name]
+    stats = SearchStats()
+    search = SEARCHES[search]
+    assert seeded(search, board, color == WHITE, stats) == seeded(search, board, color == WHITE, None)
+    assert stats.nodes > 0 and stats.leaves > 0
+    # Iterative deepening visits the root once per depth
+    assert sum(stats.nodes_per_ply) == stats.nodes and stats.nodes_per_ply[0] == max(len(stats.depths), 1)
+
+
+@pytest.mark.parametrize('engine', sorted(set(ENGINES) - {'iterative'}))
+def test_engines_play_the_same_move_with_stats(engine):
+    # iterative is left out: its depth depends on the clock
+    board, color = positions()['midgame']
+    stats = SearchStats()
+    assert seeded(ENGINES[engine], board, color, stats=stats) == seeded(ENGINES[engine], board, color)
+
+
+def test_to_json_has_the_requested_fields():
+    board, color = positions()['midgame']
+    stats = SearchStats()
+    iterative_deepening_search(board, 60, color == WHITE, max_depth=3, stats=stats)
+    report = json.loads(stats.to_json())
+    assert report['nodes'] == stats.nodes and report['leaves'] == stats.leaves
+    assert sum(report['nodes_per_ply']) == stats.nodes
+    assert len(report['cutoffs_per_ply']) > 0 and sum(report['cutoffs_per_ply']) > 0
+    assert report['effective_branching_factor'] > 1
+    assert report['movegen_seconds'] > 0 and report['eval_seconds'] > 0
+    assert [entry['depth'] for entry in report['depths']] == [1, 2, 3]
+    assert all(entry['completed'] and entry['seconds'] > 0 and entry['nodes'] > 0 for entry in report['depths'])
+    assert sum(entry['nodes'] for entry in report['depths']) == stats.nodes
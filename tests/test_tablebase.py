@@ -0,0 +1,142 @@
+import collections
+import itertools
+import os
+import random
+import numpy as np
+import pytest
+from checkers.board import Board
+from checkers.constants import ROWS, COLS, RED, WHITE, KING
+from minimax.tablebase import (Tablebase, build_all, build_table, save_table, signatures, signature_name, table_size,
+                               position_index, _position_indices, SQUARES, DRAW, WIN, LOSS, INVALID)
+
+# Three pieces with two identical ones, so the combination ranking of a run is exercised
+KING_AND_TWO_KINGS = ((WHITE, KING), (RED, KING), (RED, KING))
+
+
+@pytest.fixture(scope='module')
+def tablebase(tmp_path_factory):
+    # Two-piece tables build in well under a second, this three-piece one in a few seconds
+    directory = str(tmp_path_factory.mktemp('tablebases'))
+    solved = build_all(2, directory)
+    table = build_table(KING_AND_TWO_KINGS, solved)
+    save_table(os.path.join(directory, signature_name(KING_AND_TWO_KINGS) + '.tb'), KING_AND_TWO_KINGS, *table)
+    return Tablebase(directory)
+
+
+def solve(board, color, depth):
+    """(value, distance) for color to move found by exhaustive search, or None if undecided within depth."""
+    moves = board.legal_moves(color)
+    if not moves:
+        return LOSS, 0
+    if depth == 0:
+        return None
+    next_color = RED if color == WHITE else WHITE
+    win = None
+    all_lost, longest = True, 0
+    for move in moves:
+        undo = board.make_move(move)
+        try:
+            # Capturing the last piece wins at once
+            result = (LOSS, 0) if board.winner() is not None else solve(board, next_color, depth - 1)
+        finally:
+            board.unmake_move(undo)
+        if result is not None and result[0] == LOSS:
+            win = result[1] + 1 if win is None else min(win, result[1] + 1)
+        if result is not None and result[0] == WIN:
+            longest = max(longest, result[1] + 1)
+        else:
+            all_lost = False
+    if win is not None:
+        return WIN, win
+    if all_lost:
+        return LOSS, longest
+    return None
+
+
+def random_position(rng, choices=None):
+    while True:
+        signature = rng.choice(choices or signatures(2) + [KING_AND_TWO_KINGS])
+        squares = rng.sample(range(ROWS * COLS), len(signature))
+        # Soldiers and queens never stand on a promotion row
+        if all(piece_type == KING or square // COLS not in (0, ROWS - 1)
+               for (_, piece_type), square in zip(signature, squares)):
+            break
+    fen_rows = [['.'] * COLS for _ in range(ROWS)]
+    letters = {1: 's', 2: 'q', 3: 'k'}
+    for (color, piece_type), square in zip(signature, squares):
+        letter = letters[piece_type]
+        fen_rows[square // COLS][square % COLS] = letter.upper() if color == WHITE else letter
+    placement = '/'.join(''.join(row).replace('.' * 9, '9') for row in fen_rows)
+    for run in range(8, 0, -1):
+        placement = placement.replace('.' * run, str(run))
+    return Board.from_fen(placement + ' w'), rng.choice((WHITE, RED))
+
+
+def test_tablebase_matches_exhaustive_search(tablebase):
+    rng = random.Random(1)
+    checked = 0
+    while checked < 400:
+        board, color = random_position(rng)
+        value, distance = tablebase.probe(board, color)
+        if value == INVALID:
+            continue
+        if value == DRAW:
+            # No forced result within a few plies
+            assert solve(board, color, 4) is None, board.to_fen(color)
+        elif distance <= 5:
+            assert solve(board, color, distance) == (value, distance), board.to_fen(color)
+        else:
+            continue
+        checked += 1
+
+
+def test_three_piece_results_agree_one_ply_down(tablebase):
+    # Won in d: some move reaches a position lost in d - 1 and none a quicker loss.
+    # Lost in d: every move reaches a position won in under d, one of them in d - 1.
+    rng = random.Random(2)
+    checked = collections.Counter()
+    while min(checked[WIN], checked[LOSS], checked[DRAW]) < 30:
+        board, color = random_position(rng, [KING_AND_TWO_KINGS])
+        value, distance = tablebase.probe(board, color)
+        if value == INVALID:
+            continue
+        next_color = RED if color == WHITE else WHITE
+        children = []
+        for move in board.legal_moves(color):
+            undo = board.make_move(move)
+            # Taking the last enemy piece leaves the opponent lost in 0
+            children.append((LOSS, 0) if board.winner() is not None else tablebase.probe(board, next_color))
+            board.unmake_move(undo)
+        if value == WIN:
+            assert min(d for v, d in children if v == LOSS) == distance - 1
+        elif value == LOSS:
+            assert all(v == WIN and d < distance for v, d in children)
+            assert max(d for _, d in children) == distance - 1
+        else:
+            assert all(v != LOSS for v, _ in children) and any(v == DRAW for v, _ in children)
+        checked[value] += 1
+
+
+def test_position_index_is_gap_free():
+    signature = KING_AND_TWO_KINGS
+    squares = [np.array(column) for column in zip(*(
+        combination for combination in itertools.product(range(SQUARES), repeat=3)
+        if combination[0] not in combination[1:] and combination[1] < combination[2]))]
+    indices = _position_indices(signature, squares)
+    assert (np.sort(indices) == np.arange(table_size(signature))).all()
+    rng = random.Random(3)
+    for _ in range(200):
+        sample = rng.randrange(len(indices))
+        white, red_a, red_b = (int(column[sample]) for column in squares)
+        # Swapping the identical pieces gives the same position
+        assert position_index(signature, [white, red_a, red_b]) == indices[sample]
+        assert position_index(signature, [white, red_b, red_a]) == indices[sample]
+
+
+def test_files_are_compact(tablebase):
+    for signature in signatures(2) + [KING_AND_TWO_KINGS]:
+        path = os.path.join(tablebase.directory, signature_name(signature) + '.tb')
+        entries = table_size(signature) * 2
+        # 2 bits of value plus at most a byte of distance per entry, and the header
+        assert os.path.getsize(path) <= 8 + (entries + 3) // 4 + entries + 1
+    assert table_size(KING_AND_TWO_KINGS) == 81 * 80 * 79 // 2
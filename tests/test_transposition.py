@@ -0,0 +1,39 @@
+from checkers.board import Board
+from checkers.constants import WHITE
+from helpers import random_positions
+from minimax.algorithm import alpha_beta_minimax, alpha_beta_search
+from minimax.transposition import TranspositionTable, EXACT, LOWER
+
+
+def test_search_with_table_matches_plain_alpha_beta():
+    tt = TranspositionTable(1 << 16)
+    for board, color in random_positions(40, seed=11):
+        for depth in (1, 2, 3, 4):
+            hits, misses = tt.hits, tt.misses
+            tt.new_search()
+            with_table = alpha_beta_search(board, depth, float('-inf'), float('inf'), color == WHITE, tt)
+            plain = alpha_beta_minimax(board, depth, float('-inf'), float('inf'), color == WHITE, None)
+            assert with_table[0] == plain[0], board.to_fen(color)
+            if board.winner() is None:
+                assert tt.hits + tt.misses > hits + misses
+    # Transpositions within a search and entries kept from earlier searches are both found
+    assert tt.hits > 0
+    assert 0 < tt.hit_rate() < 1
+
+
+def test_key_depends_on_side_to_move():
+    board = Board()
+    assert TranspositionTable.key(board, True) != TranspositionTable.key(board, False)
+
+
+def test_depth_preferred_replacement():
+    tt = TranspositionTable(16)
+    tt.store(5, 4, EXACT, 1.0, None)
+    tt.store(5, 2, LOWER, 2.0, None)
+    assert tt.probe(5)[1:4] == (4, EXACT, 1.0)
+    # An entry from an earlier search is replaced even by a shallower result
+    tt.new_search()
+    tt.store(5, 2, LOWER, 2.0, None)
+    assert tt.probe(5)[1:4] == (2, LOWER, 2.0)
+    assert tt.probe(21) is None
+    assert (tt.hits, tt.misses) == (2, 1)
@@ -0,0 +1,60 @@
+import threading
+import time
+import pytest
+from checkers.board import Board
+from minimax.algorithm import SearchAborted
+from minimax.worker import PENDING, SearchWorker
+
+
+def wait(worker):
+    # poll() as the game loop does once per frame, until the search has finished
+    for _ in range(500):
+        result = worker.poll()
+        if result is not PENDING:
+            return result
+        time.sleep(0.01)
+    raise AssertionError('search never finished')
+
+
+def count_pieces(position, stop=None):
+    return sum(piece != 0 for row in position.board for piece in row)
+
+
+def failing_search(position, stop=None):
+    raise ValueError('engine bug')
+
+
+def blocking_search(position, release, stop=None):
+    release.wait()
+    if stop.is_set():
+        raise SearchAborted
+    return 'late'
+
+
+def test_result_is_returned():
+    worker = SearchWorker()
+    worker.start(count_pieces, Board())
+    assert wait(worker) == count_pieces(Board())
+    assert not worker.busy()
+
+
+def test_search_error_is_raised_from_poll():
+    worker = SearchWorker()
+    worker.start(failing_search, Board())
+    with pytest.raises(ValueError, match='engine bug'):
+        wait(worker)
+    # The error is reported once and the worker can run the next search
+    assert not worker.busy() and worker.poll() is PENDING
+    worker.start(count_pieces, Board())
+    assert wait(worker) == count_pieces(Board())
+
+
+def test_cancelled_result_is_dropped():
+    worker = SearchWorker()
+    release = threading.Event()
+    worker.start(blocking_search, Board(), release)
+    thread = worker.thread
+    worker.cancel()
+    release.set()
+    thread.join()
+    assert worker.poll() is PENDING